@@ -1,10 +1,23 @@
 from fastmcp import FastMCP, Context
 from src.utils.api_searcher import APISearcher
+from src.utils.source_cache import SourceCache, DEFAULT_CACHE_DIR
+from src.utils.source_fetcher import SourceFetcher, SourceUnavailable, GITHUB_RAW_BASE_URL
+from src.utils.prefetch import BUNDLE_FILENAME, load_bundle, run_prefetch
+from src.utils.search_executor import SearchExecutor
+from src.utils.loadtest import run_load_test
+from src.utils.metrics import OPENMETRICS_CONTENT_TYPE, ServerMetrics, stats_samples
+from src.utils.profiling import DEFAULT_PROFILE_DIR, CallProfiler
+from src.utils.query_log import DEFAULT_QUERY_LOG_DIR, QueryLog
+from src.utils.source_slicer import DETAIL_LEVELS, SourceSlicer
+from starlette.requests import Request
+from starlette.responses import Response
+import argparse
 import asyncio
+import httpx
 import os
-import requests
-import time
 import re
+import signal
+import sys
 
 # 프롬프트 등록을 위한 import
 from src.prompts.prompt import register_prompts
@@ -17,10 +30,120 @@ mcp = FastMCP(
 
 )
 
+# 도구 / 리소스 호출 지표 (OpenMetrics: internal://kis-api-metrics 리소스, http / sse 모드에서는 GET /metrics)
+server_metrics = ServerMetrics()
+mcp.add_middleware(server_metrics)
+metrics = server_metrics.registry
+search_latency = metrics.histogram(
+    "kis_search_duration_seconds", "APISearcher.search latency through the search worker pool")
+source_fetch_latency = metrics.histogram(
+    "kis_source_fetch_duration_seconds", "Upstream example source fetch latency by HTTP status (error = transport failure)")
+
+# 옵트인 호출 프로파일링 (KIS_PROFILE=1, smithery 의 debug 설정), 꺼져 있으면 미들웨어 / 훅을 등록하지 않음
+call_profiler = None
+if os.environ.get("KIS_PROFILE", "").lower() in ("1", "true", "yes"):
+    call_profiler = CallProfiler(
+        os.environ.get("KIS_PROFILE_DIR", DEFAULT_PROFILE_DIR),
+        rate=float(os.environ.get("KIS_PROFILE_RATE", 1.0)),
+        targets=os.environ.get("KIS_PROFILE_TARGETS", "").split(","),
+        min_duration=float(os.environ.get("KIS_PROFILE_MIN_MS", 0)) / 1000,
+    )
+    mcp.add_middleware(call_profiler)
+
+# 옵트인 검색 질의 로그 (KIS_QUERY_LOG=1, 인덱스 / 캐시 크기 조정용, 사용자 질문 원문이 파일에 남음)
+# 링 버퍼에 넣기만 하고 파일 쓰기는 백그라운드 스레드에서 처리
+query_log = None
+if os.environ.get("KIS_QUERY_LOG", "").lower() in ("1", "true", "yes"):
+    query_log = QueryLog(
+        os.environ.get("KIS_QUERY_LOG_DIR", DEFAULT_QUERY_LOG_DIR),
+        capacity=int(os.environ.get("KIS_QUERY_LOG_BUFFER", 4096)),
+        flush_interval=float(os.environ.get("KIS_QUERY_LOG_FLUSH_INTERVAL", 1.0)),
+        max_bytes=int(os.environ.get("KIS_QUERY_LOG_MAX_BYTES", 16 * 1024 * 1024)),
+        backups=int(os.environ.get("KIS_QUERY_LOG_BACKUPS", 10)),
+    )
+    mcp.add_middleware(query_log)
+
 # 절대 경로로 data.csv 파일 지정
 script_dir = os.path.dirname(os.path.abspath(__file__))
 data_path = os.path.join(script_dir, "data2.csv")
-searcher = APISearcher(data_path)
+# data.csv 의 TR ID / REST 경로 / 응답 필드 / 예시 질문을 (category, function_name) 기준으로 카탈로그에 합침
+supplement_path = os.path.join(script_dir, "data.csv")
+search_executor_mode = os.environ.get("KIS_SEARCH_EXECUTOR", "thread")
+# 여러 프로세스(process 워커 / 서버 여러 개)가 컴파일 카탈로그 mmap 을 읽기 전용으로 공유
+catalog_shared = os.environ.get(
+    "KIS_CATALOG_SHARED", "1" if search_executor_mode == "process" else "0"
+).lower() not in ("0", "false", "no")
+searcher_options = {
+    "cache_size": int(os.environ.get("KIS_SEARCH_CACHE_SIZE", 256)),
+    "cache_ttl": float(os.environ.get("KIS_SEARCH_CACHE_TTL", 300)),
+    "shared": catalog_shared,
+    "supplement_path": supplement_path if os.path.exists(supplement_path) else None,
+}
+searcher = APISearcher(data_path, **searcher_options)
+# data2.csv 가 바뀌면 재시작 없이 백그라운드에서 인덱스를 다시 만들어 교체
+# (process 워커 모드에서도 감시 / 재컴파일은 이 프로세스만 함)
+if os.environ.get("KIS_CATALOG_WATCH", "1").lower() not in ("0", "false", "no"):
+    searcher.start_watching(float(os.environ.get("KIS_CATALOG_WATCH_INTERVAL", 5)))
+
+# 검색은 이벤트 루프 밖의 워커 풀에서 실행 (리소스 fetch 등이 검색에 막히지 않도록)
+def create_search_executor(workers=None) -> SearchExecutor:
+    return SearchExecutor(
+        searcher,
+        mode=search_executor_mode,
+        workers=workers or int(os.environ.get("KIS_SEARCH_WORKERS", 0)) or None,
+        queue_size=int(os.environ.get("KIS_SEARCH_QUEUE_SIZE", 64)),
+        queue_timeout=float(os.environ.get("KIS_SEARCH_QUEUE_TIMEOUT", 10)),
+        searcher_options=searcher_options,
+        latency=search_latency,
+        profiler=call_profiler,
+    )
+
+
+search_executor = create_search_executor()
+
+# GitHub 예제 소스 fetcher (공유 커넥션 풀, 토큰 버킷 rate limiting, 디스크 캐시)
+source_cache = SourceCache(
+    cache_dir=os.environ.get("KIS_SOURCE_CACHE_DIR", DEFAULT_CACHE_DIR),
+    ttl=float(os.environ.get("KIS_SOURCE_CACHE_TTL", 86400)),
+    memory_size=int(os.environ.get("KIS_SOURCE_CACHE_MEMORY_SIZE", 128)),
+)
+source_fetcher = SourceFetcher(
+    os.environ.get("KIS_SOURCE_BASE_URL", GITHUB_RAW_BASE_URL),
+    cache=source_cache,
+    offline=os.environ.get("KIS_SOURCE_OFFLINE", "").lower() in ("1", "true", "yes"),
+    latency=source_fetch_latency,
+)
+# read_source_code(detail="sliced") 요약, 원본 내용 해시로 소스 캐시 옆에 저장
+source_slicer = SourceSlicer(source_cache)
+
+# 캐시 / 워커 풀이 이미 세고 있는 값은 지표 출력 시점에 읽음
+# (process 모드의 검색 결과 캐시는 워커 프로세스마다 따로 있어 이 프로세스에서 볼 수 없으므로 생략)
+if search_executor_mode != "process":
+    metrics.callback("kis_search_cache_lookups", "Search result cache lookups", "counter",
+                     lambda: stats_samples(searcher.cache.stats(), ("hits", "misses"), "result"))
+    metrics.callback("kis_search_cache_hit_ratio", "Search result cache hit ratio", "gauge",
+                     lambda: [({}, searcher.cache.stats()["hit_ratio"])])
+metrics.callback("kis_source_cache_lookups", "Example source cache lookups", "counter",
+                 lambda: stats_samples(source_cache.stats(), ("memory_hits", "disk_hits", "misses"), "result"))
+metrics.callback("kis_source_cache_hit_ratio", "Example source cache hit ratio", "gauge",
+                 lambda: [({}, source_cache.stats()["hit_ratio"])])
+metrics.callback("kis_source_fetches", "Example source fetches past the cache (coalesced = joined an in-flight request)", "counter",
+                 lambda: stats_samples(source_fetcher.stats(), ("upstream", "coalesced"), "result"))
+metrics.callback("kis_search_executor_requests", "Searches handed to the worker pool by outcome", "counter",
+                 lambda: stats_samples(search_executor.stats(), ("completed", "failed", "rejected"), "outcome"))
+metrics.callback("kis_search_executor_in_flight", "Searches running or queued in the worker pool", "gauge",
+                 lambda: [({}, search_executor.stats()["in_flight"])])
+if query_log is not None:
+    metrics.callback("kis_query_log_records", "Query log records by outcome (dropped = ring buffer overflow)", "counter",
+                     lambda: stats_samples(query_log.stats(), ("written", "dropped"), "outcome"))
+
+# 미리 받아둔 소스 번들이 있으면 캐시에 풀어 넣음 (Docker 이미지 / .dxt 배포용)
+source_bundle_path = os.environ.get("KIS_SOURCE_BUNDLE", os.path.join(script_dir, BUNDLE_FILENAME))
+if os.path.exists(source_bundle_path):
+    try:
+        load_bundle(source_cache, source_bundle_path)
+    except (OSError, ValueError) as e:
+        print(f"소스 번들 로드 실패: {e}", file=sys.stderr)
 
 # 프롬프트 등록
 register_prompts(mcp)
@@ -41,25 +164,29 @@ def extract_category_function_from_url(github_url: str) -> dict:
 # 공통 프롬프트 
 COMMON_DESCRIPTION = """
 검색 파라미터:
-query: 사용자의 원본 질문을 그대로 입력하세요 (로깅용)
+query: 사용자의 원본 질문을 그대로 입력하세요
+       (한글/영문 토큰으로 모든 텍스트 필드를 관련도 순 검색, 다른 조건과 함께 주면 결과 정렬 기준으로 사용)
 subcategory: 카테고리 내 서브카테고리 검색
 api_name: 특정 API 이름 검색
 function_name: 특정 함수 이름 검색
 description: 함수에 대한 설명 검색
-response: 응답 데이터 내용으로 검색
+response: 응답 데이터 내용으로 검색 (응답 명세가 없어 확인하지 못한 API 는 뒤쪽에 "response_unverified": true 로 표시)
+ranked: true 이면 조건을 모두 만족하는 API 대신 api_name/function_name/description/응답 필드에
+        대한 관련도(BM25) 순으로 상위 결과와 score 를 반환 (조건이 일부만 맞아도 결과가 나옴)
 
 출력 형태: JSON 객체로 반환
 - 단순 개수 조회: category/subcategory만 지정시 → API 목록만 반환
 - 상세 검색: 여러 조건 지정시 → 매칭되는 API의 상세 정보 반환
 - status: "success"/"error"/"no_results"
 - total_count: 총 검색 결과 수
-- results: API 정보 배열 (function_name, api_name, category, subcategory)
+- results: API 정보 배열 (function_name, api_name, category, subcategory, 관련도 검색 시 score)
 
 검색 전략 가이드라인:
-1. 첫 번째 검색에서 결과가 없으면, 다른 파라미터 조합으로 재시도
-2. description 파라미터는 정확히 매칭되는 키워드만 사용 
-3. 검색 실패시 순서: query만 → function_name → api_name → subcategory 순으로 시도
-4. "재무", "financial", "매출", "revenue" 등 핵심 키워드는 function_name이나 api_name으로 우선 검색
+1. 첫 번째 검색에서 결과가 없으면, ranked=true 로 같은 조건을 다시 검색하거나 다른 파라미터 조합으로 재시도
+2. description 파라미터는 정확히 매칭되는 키워드만 사용 (띄어쓰기/오타는 자동 보정되며 message에 fuzzy match 표시)
+3. 어떤 필드를 써야 할지 모르면 query만으로 먼저 검색 (한 번의 호출로 관련도 순 결과)
+4. 검색 실패시 순서: query만 → function_name → api_name → subcategory 순으로 시도
+5. "재무", "financial", "매출", "revenue" 등 핵심 키워드는 function_name이나 api_name으로 우선 검색
 
 예시 검색 전략:
 - 재무 정보 요청시: function_name="financial" 또는 function_name="finance" 우선 시도
@@ -272,41 +399,55 @@ ex) 레버리지 ETF 실시간 변동률 알려줘. -> subcategory="실시간시
 
 # KIS API 템플릿 리소스 정의
 @mcp.resource("internal://kis-api/{category}/{function_name}", mime_type="text/plain")
-def _kis_api_main_file(category: str, function_name: str) -> str:
+async def _kis_api_main_file(category: str, function_name: str) -> str:
     """KIS API 메인 파일을 읽는 템플릿 리소스"""
     if not (category and function_name):
         return "❌ 잘못된 파라미터"
     
-    url = f"https://raw.githubusercontent.com/koreainvestment/open-trading-api/main/examples_llm/{category}/{function_name}/{function_name}.py"
-    
-    # Rate limiting
-    time.sleep(0.1)
+    url = source_fetcher.main_url(category, function_name)
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException as e:
+        return await source_fetcher.fetch(url)
+    except (httpx.HTTPError, SourceUnavailable) as e:
         return f"❌ GitHub 파일 읽기 실패: {str(e)}"
 
 @mcp.resource("internal://kis-api-chk/{category}/{function_name}", mime_type="text/plain")
-def _kis_api_check_file(category: str, function_name: str) -> str:
+async def _kis_api_check_file(category: str, function_name: str) -> str:
     """KIS API 체크 파일을 읽는 템플릿 리소스"""
     if not (category and function_name):
         return "❌ 잘못된 파라미터"
     
-    url = f"https://raw.githubusercontent.com/koreainvestment/open-trading-api/main/examples_llm/{category}/{function_name}/chk_{function_name}.py"
-    
-    # Rate limiting
-    time.sleep(0.1)
+    url = source_fetcher.check_url(category, function_name)
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException as e:
+        return await source_fetcher.fetch(url)
+    except (httpx.HTTPError, SourceUnavailable) as e:
         return f"❌ GitHub 파일 읽기 실패: {str(e)}"
 
+@mcp.resource("internal://kis-api-cache/stats", mime_type="application/json")
+def _kis_api_cache_stats() -> dict:
+    """예제 소스 캐시 hit/miss 통계 (+ 요약 캐시 / 원격 요청 합치기)"""
+    return {**source_cache.stats(), "slices": source_slicer.stats(), "fetcher": source_fetcher.stats()}
+
+@mcp.resource("internal://kis-api-search/stats", mime_type="application/json")
+def _kis_api_search_stats() -> dict:
+    """검색 결과 캐시 hit/miss/eviction 통계 + 검색 워커 풀 / 질의 로그 상태 (process 모드에서 cache 는 null)"""
+    return {
+        "cache": searcher.cache.stats() if search_executor.mode != "process" else None,
+        "executor": search_executor.stats(),
+        "query_log": query_log.stats() if query_log is not None else None,
+    }
+
+@mcp.resource("internal://kis-api-metrics", mime_type="application/openmetrics-text")
+def _kis_api_metrics() -> str:
+    """도구 / 리소스 지연 시간, 호출 / 오류 횟수, 결과 개수 분포, 캐시 적중률, 원격 fetch 시간 (OpenMetrics)"""
+    return metrics.render()
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def _metrics_endpoint(request: Request) -> Response:
+    """http / sse 모드의 Prometheus 스크랩 엔드포인트"""
+    return Response(metrics.render(), media_type=OPENMETRICS_CONTENT_TYPE)
+
 
 # 공통 출력 스키마 정의 (MCP 스펙 준수: type must be "object")
 SEARCH_OUTPUT_SCHEMA = {
@@ -325,6 +466,10 @@ SEARCH_OUTPUT_SCHEMA = {
             "type": "integer",
             "description": "총 검색 결과 수"
         },
+        "catalog_version": {
+            "type": "string",
+            "description": "검색에 사용한 카탈로그 버전 (data2.csv + data.csv SHA-256 앞 12자리)"
+        },
         "results": {
             "type": "array",
             "items": {
@@ -333,7 +478,13 @@ SEARCH_OUTPUT_SCHEMA = {
                     "function_name": {"type": "string", "description": "API 함수명"},
                     "api_name": {"type": "string", "description": "API 이름"},
                     "category": {"type": "string", "description": "카테고리"},
-                    "subcategory": {"type": "string", "description": "서브카테고리"}
+                    "subcategory": {"type": "string", "description": "서브카테고리"},
+                    "score": {"type": "number", "description": "관련도 점수 (ranked 검색 시)"},
+                    "matched_fields": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                        "description": "매칭된 응답 필드 (응답 필드 검색 시, {field: 코드, label: 한글 이름})"
+                    }
                 },
                 "required": ["function_name", "api_name", "category", "subcategory"]
             },
@@ -356,9 +507,12 @@ async def search_auth_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "auth"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -370,7 +524,7 @@ async def search_auth_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 
 @mcp.tool(
@@ -385,9 +539,12 @@ async def search_domestic_stock_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "domestic_stock"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -399,7 +556,7 @@ async def search_domestic_stock_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_domestic_bond_api",
@@ -413,9 +570,12 @@ async def search_domestic_bond_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "domestic_bond"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -427,7 +587,7 @@ async def search_domestic_bond_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_domestic_futureoption_api",
@@ -441,9 +601,12 @@ async def search_domestic_futureoption_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "domestic_futureoption"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -455,7 +618,7 @@ async def search_domestic_futureoption_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_overseas_stock_api",
@@ -469,9 +632,12 @@ async def search_overseas_stock_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "overseas_stock"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -483,7 +649,7 @@ async def search_overseas_stock_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_overseas_futureoption_api",
@@ -497,9 +663,12 @@ async def search_overseas_futureoption_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "overseas_futureoption"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -511,7 +680,7 @@ async def search_overseas_futureoption_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_elw_api",
@@ -525,9 +694,12 @@ async def search_elw_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "elw"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -539,7 +711,7 @@ async def search_elw_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
 
 @mcp.tool(
     name="search_etfetn_api",
@@ -553,9 +725,12 @@ async def search_etfetn_api(
     function_name: str = None,
     description: str = None,
     response: str = None,
+    ranked: bool = False,
 ) -> str:
     search_params = {"category": "etfetn"}
     
+    if query:
+        search_params["query"] = query
     if subcategory:
         search_params["subcategory"] = subcategory
     if api_name:
@@ -567,7 +742,226 @@ async def search_etfetn_api(
     if response:
         search_params["response"] = response
     
-    return searcher.search(**search_params)
+    return await search_executor.search(ranked=ranked, **search_params)
+
+
+@mcp.tool(
+    name="lookup_api",
+    description="""TR ID 또는 REST 경로로 API 를 바로 찾습니다 (부분 문자열 검색 없이 한 번에 조회).
+
+    파라미터:
+    - identifier: TR ID (예: v1_국내선물-008) 또는 REST 경로 (예: /uapi/domestic-futureoption/v1/quotations/inquire-price, 전체 URL 도 가능)
+
+    결과에는 검색 결과 필드와 함께 api_id, url_name, method, communication 이 포함됩니다.
+    """,
+    output_schema=SEARCH_OUTPUT_SCHEMA
+)
+async def lookup_api(identifier: str) -> dict:
+    return searcher.lookup(identifier)
+
+
+@mcp.tool(
+    name="search_api_by_response_field",
+    description="""특정 응답 필드를 반환하는 API 를 찾습니다 (응답 필드 색인에서 바로 조회).
+
+    파라미터:
+    - field: 응답 필드 코드 또는 한글 이름 (예: ord_psbl_qty, 주문가능수량), 쉼표로 여러 개를 주면 모두 반환하는 API 만
+    - category: 카테고리 필터 (예: domestic_stock, overseas_stock, domestic_futureoption ...)
+    - subcategory: 서브카테고리 필터 (예: 주문/계좌, 기본시세)
+    - query: 사용자의 원본 질문 (결과 정렬 + 로깅용)
+
+    정확히 일치하는 필드가 없으면 이름을 포함하는 필드로 찾고, 결과마다 matched_fields 에 매칭된 필드를 표시합니다.
+    """,
+    output_schema=SEARCH_OUTPUT_SCHEMA
+)
+async def search_api_by_response_field(
+    field: str,
+    category: str = None,
+    subcategory: str = None,
+    query: str = None,
+) -> dict:
+    search_params = {"output_field": field}
+
+    if category:
+        search_params["category"] = category
+    if subcategory:
+        search_params["subcategory"] = subcategory
+    if query:
+        search_params["query"] = query
+
+    return await search_executor.search(**search_params)
+
+
+PARAMETER_BATCH_LIMIT = 20     # get_api_parameters 최대 함수 수
+
+
+@mcp.tool(
+    name="get_api_parameters",
+    description=f"""API 함수의 파라미터 명세를 바로 반환합니다 (GitHub 코드를 읽지 않고 카탈로그에서 조회).
+
+    파라미터:
+    - function_names: 검색 결과의 function_name 목록 (최대 {PARAMETER_BATCH_LIMIT}개, 예: ["inquire_price", "order_cash"])
+    - category: 같은 함수명이 여러 카테고리에 있을 때 사용할 카테고리 (선택)
+
+    파라미터마다 name, type, required, description, example, default 를 반환합니다.
+    파라미터만 필요하면 read_source_code 대신 이 tool을 사용하세요.
+    """,
+    output_schema={
+        "type": "object",
+        "properties": {
+            "status": {
+                "type": "string",
+                "enum": ["success", "partial_success", "no_results", "error"],
+                "description": "전체 작업 상태"
+            },
+            "message": {"type": "string", "description": "상태 메시지"},
+            "total_count": {"type": "integer", "description": "명세를 찾은 API 수"},
+            "catalog_version": {"type": "string", "description": "조회에 사용한 카탈로그 버전"},
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "function_name": {"type": "string"},
+                        "api_name": {"type": "string"},
+                        "category": {"type": "string"},
+                        "subcategory": {"type": "string"},
+                        "parameters": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "[{name, type, required, description, example, default}]"
+                        }
+                    }
+                },
+                "description": "함수별 파라미터 명세"
+            },
+            "not_found": {"type": "array", "items": {"type": "string"}, "description": "찾지 못한 함수명"}
+        },
+        "required": ["status", "message", "total_count", "results"]
+    }
+)
+async def get_api_parameters(function_names: list[str], category: str = None) -> dict:
+    if len(function_names) > PARAMETER_BATCH_LIMIT:
+        return {
+            "status": "error",
+            "message": f"한 번에 최대 {PARAMETER_BATCH_LIMIT}개까지 요청할 수 있습니다 (요청: {len(function_names)}개)",
+            "total_count": 0,
+            "results": []
+        }
+    return searcher.parameters(function_names, category)
+
+
+# 소스 코드 조회 설정
+SOURCE_FETCH_TIMEOUT = 15       # 파일 1개당 타임아웃 (초)
+SOURCE_FETCH_CONCURRENCY = 8    # 동시에 진행하는 리소스 조회 수
+SOURCE_BATCH_LIMIT = 10         # read_source_code_batch 최대 항목 수
+
+_source_semaphore = asyncio.Semaphore(SOURCE_FETCH_CONCURRENCY)
+
+
+async def _read_code(kind: str, url: str, ctx: Context, detail: str = "full") -> dict:
+    """단일 URL을 리소스 템플릿으로 읽어 결과 dict 생성 (kind: kis-api / kis-api-chk)
+
+    detail="sliced" 이면 시그니처 / docstring / 요청 구성 / 예제 호출만 남긴 요약을 반환합니다
+    (요약할 수 없는 파일은 원문).
+    """
+    params = extract_category_function_from_url(url)
+    if not params:
+        return {
+            "status": "error",
+            "message": "GitHub URL 형식이 올바르지 않습니다",
+            "content": "",
+            "url": url
+        }
+    
+    git_uri = f"internal://{kind}/{params['category']}/{params['function_name']}"
+    try:
+        async with _source_semaphore:
+            contents = await asyncio.wait_for(ctx.read_resource(git_uri), SOURCE_FETCH_TIMEOUT)
+        content = "".join(c.content for c in contents if isinstance(c.content, str))
+        # 리소스는 실패 시 예외 대신 "❌ ..." 문자열을 반환
+        if content.startswith("❌"):
+            return {
+                "status": "error",
+                "message": f"오류: {content.lstrip('❌ ')}",
+                "content": "",
+                "url": url,
+                "git_uri": git_uri
+            }
+        # 실패 응답은 위에서 반환하므로 detail 은 실제로 만든 내용(sliced 또는 원문 full)만 표시
+        if detail == "sliced":
+            sliced = source_slicer.slice(content)
+            if sliced is None:
+                detail = "full"
+            else:
+                content = sliced
+        
+        return {
+            "status": "success",
+            "message": "코드를 성공적으로 가져왔습니다",
+            "content": content,
+            "detail": detail,
+            "url": url,
+            "git_uri": git_uri
+        }
+    except asyncio.TimeoutError:
+        return {
+            "status": "error",
+            "message": f"오류: {SOURCE_FETCH_TIMEOUT}초 내에 응답이 없습니다",
+            "content": "",
+            "url": url
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"오류: {str(e)}",
+            "content": "",
+            "url": url
+        }
+
+
+async def _fetch_code_pair(url_main: str, url_chk: str, ctx: Context, detail: str = "full") -> dict:
+    """main/chk 파일을 동시에 가져와 read_source_code 응답 형태로 집계"""
+    if detail not in DETAIL_LEVELS:
+        return {
+            "status": "error",
+            "message": f"detail 은 {', '.join(DETAIL_LEVELS)} 중 하나여야 합니다 (요청: {detail})",
+            "results": {}
+        }
+    tasks = {}
+    if url_main:
+        tasks["main"] = _read_code("kis-api", url_main, ctx, detail)
+    if url_chk:
+        tasks["check"] = _read_code("kis-api-chk", url_chk, ctx, detail)
+    
+    # 전체 상태 판단
+    if not tasks:
+        return {
+            "status": "error",
+            "message": "제공된 URL이 없습니다",
+            "results": {}
+        }
+    
+    results = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values())))
+    
+    success_count = sum(1 for result in results.values() if result["status"] == "success")
+    total_count = len(results)
+    
+    if success_count == total_count:
+        status = "success"
+        message = f"모든 코드를 성공적으로 가져왔습니다 ({success_count}/{total_count})"
+    elif success_count > 0:
+        status = "partial_success"
+        message = f"일부 코드를 가져왔습니다 ({success_count}/{total_count})"
+    else:
+        status = "error"
+        message = f"모든 코드 가져오기에 실패했습니다 (0/{total_count})"
+    
+    return {
+        "status": status,
+        "message": message,
+        "results": results
+    }
 
 
 @mcp.tool(
@@ -577,6 +971,7 @@ async def search_etfetn_api(
     파라미터:
     - url_main: 메인 호출 파일 URL (필수)
     - url_chk: 테스트 호출 파일 URL (선택)
+    - detail: "full"(파일 전체, 기본값) 또는 "sliced"(함수 시그니처, docstring, 요청 구성 부분, 예제 호출만)
     
     사용 예시:
     1. api_search tool로 원하는 API를 찾습니다
@@ -604,6 +999,7 @@ async def search_etfetn_api(
                             "status": {"type": "string"},
                             "message": {"type": "string"},
                             "content": {"type": "string", "description": "실제 코드 내용"},
+                            "detail": {"type": "string", "description": "full / sliced (요약할 수 없으면 full)"},
                             "url": {"type": "string"}
                         }
                     },
@@ -613,6 +1009,7 @@ async def search_etfetn_api(
                             "status": {"type": "string"},
                             "message": {"type": "string"},
                             "content": {"type": "string", "description": "실제 코드 내용"},
+                            "detail": {"type": "string", "description": "full / sliced (요약할 수 없으면 full)"},
                             "url": {"type": "string"}
                         }
                     }
@@ -626,93 +1023,84 @@ async def search_etfetn_api(
 async def fetch_api_code(
     url_main: str,
     url_chk: str = None,
+    detail: str = "full",
     ctx: Context = None
 ) -> dict:
-    """API URL에서 실제 GitHub 코드를 가져옴 (템플릿 리소스 사용)"""
-    results = {}
+    """API URL에서 실제 GitHub 코드를 가져옴 (템플릿 리소스 사용, main/chk 동시 요청)"""
+    return await _fetch_code_pair(url_main, url_chk, ctx, detail)
+
+
+@mcp.tool(
+    name="read_source_code_batch",
+    description=f"""여러 API의 GitHub 코드를 한 번에 병렬로 가져옵니다.
     
-    # 메인 URL 처리
-    if url_main:
-        params = extract_category_function_from_url(url_main)
-        if params:
-            git_uri = f"internal://kis-api/{params['category']}/{params['function_name']}"
-            try:
-                # Context를 통해 MCP Resource 직접 호출 (FastMCP 자동 캐싱)
-                content = await ctx.read_resource(git_uri)
-                
-                results["main"] = {
-                    "status": "success",
-                    "message": "코드를 성공적으로 가져왔습니다",
-                    "content": content,
-                    "url": url_main,
-                    "git_uri": git_uri
-                }
-            except Exception as e:
-                results["main"] = {
-                    "status": "error",
-                    "message": f"오류: {str(e)}",
-                    "content": "",
-                    "url": url_main
-                }
-        else:
-            results["main"] = {
-                "status": "error",
-                "message": "GitHub URL 형식이 올바르지 않습니다",
-                "content": "",
-                "url": url_main
-            }
+    파라미터:
+    - items: 검색 결과의 url_main, url_chk 쌍 목록 (예: [{{"url_main": "...", "url_chk": "..."}}])
+    - detail: "full"(파일 전체, 기본값) 또는 "sliced"(함수 시그니처, docstring, 요청 구성 부분, 예제 호출만)
     
-    # 체크 URL 처리  
-    if url_chk:
-        params = extract_category_function_from_url(url_chk)
-        if params:
-            git_uri = f"internal://kis-api-chk/{params['category']}/{params['function_name']}"
-            try:
-                # Context를 통해 MCP Resource 직접 호출 (FastMCP 자동 캐싱)
-                content = await ctx.read_resource(git_uri)
-                
-                results["check"] = {
-                    "status": "success",
-                    "message": "코드를 성공적으로 가져왔습니다",
-                    "content": content,
-                    "url": url_chk,
-                    "git_uri": git_uri
-                }
-            except Exception as e:
-                results["check"] = {
-                    "status": "error",
-                    "message": f"오류: {str(e)}",
-                    "content": "",
-                    "url": url_chk
-                }
-        else:
-            results["check"] = {
-                "status": "error",
-                "message": "GitHub URL 형식이 올바르지 않습니다",
-                "content": "",
-                "url": url_chk
+    사용 예시:
+    1. api_search tool로 후보 API 여러 개를 찾습니다
+    2. 검색 결과 항목들을 그대로 items로 전달합니다 (최대 {SOURCE_BATCH_LIMIT}개)
+    3. 각 항목별로 read_source_code와 같은 형태의 결과를 받습니다
+    """,
+    output_schema={
+        "type": "object",
+        "properties": {
+            "status": {
+                "type": "string",
+                "enum": ["success", "partial_success", "error"],
+                "description": "전체 작업 상태"
+            },
+            "message": {
+                "type": "string",
+                "description": "상태 메시지"
+            },
+            "results": {
+                "type": "array",
+                "items": {"type": "object"},
+                "description": "항목별 read_source_code 결과 (입력 순서 유지)"
             }
-    
-    # 전체 상태 판단
-    if not results:
+        },
+        "required": ["status", "message", "results"]
+    }
+)
+async def fetch_api_code_batch(
+    items: list[dict],
+    detail: str = "full",
+    ctx: Context = None
+) -> dict:
+    """여러 (url_main, url_chk) 쌍을 동시 실행 수 제한 하에 병렬로 가져옴"""
+    if not items:
         return {
             "status": "error",
             "message": "제공된 URL이 없습니다",
-            "results": {}
+            "results": []
+        }
+    if len(items) > SOURCE_BATCH_LIMIT:
+        return {
+            "status": "error",
+            "message": f"한 번에 최대 {SOURCE_BATCH_LIMIT}개까지 요청할 수 있습니다 (요청: {len(items)}개)",
+            "results": []
         }
     
-    success_count = sum(1 for result in results.values() if result["status"] == "success")
+    results = await asyncio.gather(*(
+        _fetch_code_pair(item.get("url_main"), item.get("url_chk"), ctx, detail)
+        for item in items
+    ))
+    
+    success_count = sum(1 for result in results if result["status"] == "success")
+    error_count = sum(1 for result in results if result["status"] == "error")
     total_count = len(results)
     
     if success_count == total_count:
         status = "success"
-        message = f"모든 코드를 성공적으로 가져왔습니다 ({success_count}/{total_count})"
-    elif success_count > 0:
-        status = "partial_success"
-        message = f"일부 코드를 가져왔습니다 ({success_count}/{total_count})"
-    else:
+        message = f"모든 API 코드를 성공적으로 가져왔습니다 ({success_count}/{total_count})"
+    elif error_count == total_count:
         status = "error"
-        message = f"모든 코드 가져오기에 실패했습니다 (0/{total_count})"
+        message = f"모든 API 코드 가져오기에 실패했습니다 (0/{total_count})"
+    else:
+        status = "partial_success"
+        message = f"일부 API 코드를 가져왔습니다 ({success_count}/{total_count})"
     
     return {
         "status": status,
@@ -721,13 +1109,88 @@ async def fetch_api_code(
     }
 
 
+TRANSPORTS = ("stdio", "http", "sse")
+
+
+async def run_server(transport: str = "stdio", host: str = "127.0.0.1", port: int = 8000,
+                     graceful_timeout: float = 10.0):
+    """MCP 서버 실행 후 검색 워커 풀 / 카탈로그 감시 / HTTP 커넥션 풀 / 질의 로그 정리
+
+    http / sse 모드는 프로세스 하나(인덱스 / 캐시 공유)가 여러 클라이언트 세션을 처리합니다.
+    SIGINT / SIGTERM 을 받으면 새 연결을 받지 않고 진행 중인 요청을 graceful_timeout 초까지 기다린 뒤 종료합니다.
+    """
+    try:
+        if transport == "stdio":
+            await mcp.run_stdio_async()
+        else:
+            await mcp.run_http_async(
+                transport=transport,
+                host=host,
+                port=port,
+                uvicorn_config={"timeout_graceful_shutdown": graceful_timeout},
+            )
+    finally:
+        search_executor.shutdown()
+        searcher.stop_watching()
+        await source_fetcher.aclose()
+        if query_log is not None:
+            query_log.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KIS API 검색 MCP 서버")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=os.environ.get("KIS_MCP_TRANSPORT", "stdio"),
+                        help="stdio: 클라이언트가 실행하는 단일 세션, http(streamable-http) / sse: 여러 세션을 받는 공유 서버")
+    parser.add_argument("--host", default=os.environ.get("KIS_MCP_HOST", "127.0.0.1"), help="http / sse 바인드 주소")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("KIS_MCP_PORT", 8000)), help="http / sse 포트")
+    parser.add_argument("--workers", type=int, default=None, help="검색 워커 수 (기본: KIS_SEARCH_WORKERS 또는 min(4, CPU 수))")
+    parser.add_argument("--graceful-timeout", type=float, default=10.0, help="종료 시 진행 중인 요청을 기다리는 시간(초)")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    prefetch = subparsers.add_parser("prefetch", help="모든 예제 소스를 미리 받아 캐시와 번들 파일로 저장")
+    prefetch.add_argument("--concurrency", type=int, default=16, help="동시 다운로드 수")
+    prefetch.add_argument("--retries", type=int, default=3, help="일시적 오류 재시도 횟수")
+    prefetch.add_argument("--rate", type=float, default=50.0, help="초당 최대 요청 수")
+    prefetch.add_argument("--bundle", default=source_bundle_path, help="생성할 번들 파일 경로")
+    
+    loadtest = subparsers.add_parser("loadtest", help="실행 중인 http 서버에 동시 세션 수를 늘려 가며 부하 테스트")
+    loadtest.add_argument("--url", default="http://127.0.0.1:8000/mcp/", help="서버 주소 (sse 는 .../sse/)")
+    loadtest.add_argument("--sessions", default="1,4,16,64", help="동시 세션 수 목록 (쉼표 구분)")
+    loadtest.add_argument("--requests", type=int, default=20, help="세션당 도구 호출 수")
+    
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    
+    if args.command == "prefetch":
+        fetcher = SourceFetcher(
+            source_fetcher.base_url,
+            cache=source_cache,
+            rate=args.rate,
+            burst=args.concurrency,
+            max_connections=args.concurrency,
+        )
+        sys.exit(asyncio.run(run_prefetch(fetcher, data_path, args.bundle, args.concurrency, args.retries)))
+    
+    if args.command == "loadtest":
+        sessions = [int(n) for n in args.sessions.split(",") if n.strip()]
+        sys.exit(asyncio.run(run_load_test(args.url, sessions, args.requests)))
+    
+    if args.workers:
+        search_executor.shutdown()
+        search_executor = create_search_executor(args.workers)
+    
+    # uvicorn 은 graceful shutdown 후 받은 시그널을 원래 핸들러로 다시 보내므로, SIGTERM 도 SIGINT 처럼
+    # KeyboardInterrupt 로 받아야 정리 코드(run_server finally, 워커 프로세스 종료)가 실행됨
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
     try:
-        # FastMCP 2.x 버전에서 stdio 모드로 실행
-        asyncio.run(mcp.run_stdio_async())
+        # FastMCP 2.x: stdio(기본) 또는 streamable-http / sse 모드로 실행
+        asyncio.run(run_server(args.transport, args.host, args.port, args.graceful_timeout))
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
-        import sys
         print(f"서버 실행 오류: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -1,117 +1,722 @@
-import pandas as pd
-from typing import Optional, Dict, Any, List
+import contextlib
+import os
+import sys
+import threading
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
+
+from src.utils.catalog import catalog_version, normalize_field_key, open_catalog, parse_column_mapping
+from src.utils.result_cache import ResultCache
+from src.utils.search_index import REGEX_META_CHARS, BM25Index, SearchIndex, bitmap_rows, to_bitmap, top_k
+
+class SearchState:
+    """카탈로그 하나로 만든 검색 상태 (만든 뒤에는 변경하지 않음)
+
+    재로드 시 새 상태를 따로 만든 뒤 참조 한 번으로 교체하므로,
+    진행 중인 검색은 시작할 때 잡은 상태를 끝까지 사용합니다.
+    교체된 상태는 마지막 사용자가 끝날 때 카탈로그(파일 / mmap)를 닫습니다.
+    """
+
+    def __init__(self, catalog, index: SearchIndex, ranker: BM25Index, query_ranker: BM25Index):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.index = index
+        self.ranker = ranker
+        self.query_ranker = query_ranker
+        # 로드 시 미리 만든 결과 레코드 / 정확 매칭 조건별 응답
+        self.records: List[dict] = []
+        self.summaries: List[dict] = []
+        self.payloads: Dict[tuple, dict] = {}
+        # 행 번호 -> [(응답 코드, 한글 이름, 정규화 코드, 정규화 이름)] (응답 필드 검색 결과에 처음 나온 행만 파싱)
+        self.response_fields = RowRecords(self._parse_fields)
+        # 행 번호 -> 파라미터 명세 (카탈로그 빌드 시 args 를 파싱해 둔 것, 처음 요청된 행만 읽어 보관)
+        self.arg_specs = RowRecords(catalog.arg_specs)
+        # 이 상태를 사용 중인 호출 수 / 재로드로 교체되었는지 (APISearcher._state_lock 으로 보호)
+        self.users = 0
+        self.retired = False
+
+    def close(self) -> None:
+        """카탈로그를 닫음 (mmap 위의 뷰를 잡고 있는 색인 / 레코드 참조를 먼저 끊음)"""
+        self.index = self.ranker = self.query_ranker = None
+        self.records, self.summaries, self.payloads = [], [], {}
+        self.response_fields = self.arg_specs = None
+        self.catalog.close()
+
+    def _parse_fields(self, row: int) -> List[Tuple[str, str, str, str]]:
+        catalog = self.catalog
+        if catalog.field_column is None:
+            return []
+        mapping = parse_column_mapping(catalog.value(row, catalog.field_column))
+        return [(code, label, normalize_field_key(code), normalize_field_key(label)) for code, label in mapping.items()]
+
+
+class RowRecords:
+    """행 번호 -> 결과 레코드 (처음 요청된 행만 만들어 보관, shared 모드 / 응답 필드 목록에서 사용)"""
+
+    def __init__(self, build: Callable[[int], Any]):
+        self._build = build
+        self._items: Dict[int, Any] = {}
+
+    def __getitem__(self, row: int) -> Any:
+        item = self._items.get(row)
+        if item is None:
+            item = self._items.setdefault(row, self._build(row))
+        return item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 class APISearcher:
     """API 검색 클래스 - 성능 최적화 버전"""
-    
+
     # 실제 사용되는 정확 매칭 필드만
     EXACT_MATCH_FIELDS = {'subcategory', 'category'}
+    # 매칭 결과가 없을 때 오타/띄어쓰기 허용 검색으로 다시 찾는 필드
+    FUZZY_MATCH_FIELDS = {'api_name', 'function_name', 'subcategory', 'description'}
+    # 검색 결과에 쓰이는 메타데이터 컬럼 (lazy_columns 모드에서 메모리에 상주)
+    RESIDENT_COLUMNS = ('category', 'subcategory', 'api_name', 'function_name', 'url_main', 'url_chk')
+    # ranked 검색(BM25)에 쓰이는 필드별 가중치
+    RANK_FIELD_WEIGHTS = {'api_name': 3.0, 'function_name': 2.0, 'description': 1.0, 'column_mapping': 0.5}
+    # 자유 검색어(query)는 URL 을 제외한 모든 텍스트 컬럼에서 검색
+    QUERY_FIELD_WEIGHTS = {**RANK_FIELD_WEIGHTS, 'args': 0.3, 'returns': 0.3, 'example': 0.2}
+    # 해시 조회 필드 (TR ID, REST 경로 순으로 시도)
+    LOOKUP_FIELDS = ('api_id', 'url_name')
+    # 파라미터 명세 조회에 쓰는 해시 조회 필드
+    NAME_LOOKUP_FIELD = 'function_name'
+    # 응답 필드 역색인 검색 조건 이름 (column_mapping 의 코드 또는 한글 이름, 쉼표로 여러 개)
+    OUTPUT_FIELD_PARAM = 'output_field'
+    # data.csv 에서 합쳐진 컬럼 -> 함께 검색할 컬럼 (응답 코드/이름 매핑, 예시 질문)
+    # (어디에도 없고 합쳐진 컬럼 값이 비어 있는 행은 확인된 결과 뒤에 response_unverified 로 표시해 반환)
+    SUPPLEMENT_FALLBACK_FIELDS = {'response': ('column_mapping', 'example_question')}
     MAX_RESULTS = 10
     DESCRIPTION_LENGTH = 100
-    
-    def __init__(self, filepath: str = "data2.csv"):
-        self._data = None
+
+    def __init__(self, filepath: str = "data2.csv", lazy_columns: bool = True,
+                 cache_size: int = 256, cache_ttl: float = 300.0, shared: bool = False,
+                 supplement_path: Optional[str] = None):
+        """supplement_path(data.csv)가 주어지면 TR ID / REST 경로 / 응답 필드 컬럼을 카탈로그에 합칩니다.
+
+        shared=True 이면 컴파일 카탈로그(mmap)에 읽기 전용으로 붙어 모든 컬럼과 인덱스를 파일에서 읽고,
+        결과 레코드는 요청된 행만 만듭니다. 같은 호스트의 여러 프로세스가 페이지 캐시 한 벌을 공유하므로
+        프로세스를 추가해도 메모리가 거의 늘지 않고, 시작 시 CSV 파싱과 응답 사전 생성을 건너뜁니다.
+        """
+        self.filepath = filepath
+        self._state: Optional[SearchState] = None
+        self.lazy_columns = lazy_columns
+        self.shared = shared
+        self.supplement_path = supplement_path
+        # 같은 조건 재검색(재시도 가이드) 결과 캐시, 키에 카탈로그 버전 포함
+        self.cache = ResultCache(cache_size, cache_ttl)
+        self._reload_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
         self.load_data(filepath)
-    
+
+    @property
+    def catalog_version(self) -> Optional[str]:
+        state = self._state
+        return state.version if state is not None else None
+
     def load_data(self, filepath: str = "data2.csv") -> str:
-        """CSV 데이터 로드 (에러 처리 강화)"""
+        """카탈로그 로드 (컴파일된 .kiscat 이 최신이면 mmap, 아니면 CSV 로드 후 컴파일)
+
+        lazy_columns=True 이면 메타데이터 컬럼만 메모리에 두고 description/args/example 등
+        대용량 텍스트 컬럼은 해당 필드로 검색할 때만 파일에서 읽습니다.
+        새 인덱스를 모두 만든 뒤 교체하므로 실패하면 기존 카탈로그를 계속 사용합니다.
+        """
         try:
-            self._data = pd.read_csv(filepath)
-            return f"Loaded {len(self._data)} APIs"
+            with self._reload_lock:
+                state = self._build_state(filepath)
+                with self._state_lock:
+                    previous = self._state
+                    self._state = state
+                self.filepath = filepath
+            if previous is not None:
+                if previous.version != state.version:
+                    self.cache.invalidate()
+                self._release(previous, retire=True)
+            return f"Loaded {state.catalog.row_count} APIs"
         except FileNotFoundError:
             return f"❌ Data file not found: {filepath}"
         except Exception as e:
             return f"❌ Error loading data: {e}"
-    
-    def search(self, **kwargs) -> dict:
-        """통합 API 검색 (성능 최적화)"""
-        if self._data is None:
+
+    @contextlib.contextmanager
+    def _holding_state(self):
+        """현재 검색 상태를 호출이 끝날 때까지 사용 중으로 표시 (없으면 None)"""
+        with self._state_lock:
+            state = self._state
+            if state is not None:
+                state.users += 1
+        try:
+            yield state
+        finally:
+            if state is not None:
+                self._release(state)
+
+    def _release(self, state: SearchState, retire: bool = False) -> None:
+        """사용 종료 (retire=True 는 재로드로 교체됨), 교체된 상태의 마지막 사용자면 닫음"""
+        with self._state_lock:
+            if retire:
+                state.retired = True
+            else:
+                state.users -= 1
+            close = state.retired and state.users == 0
+        if close:
+            state.close()
+
+    def _build_state(self, filepath: str) -> SearchState:
+        exact_fields = sorted(self.EXACT_MATCH_FIELDS)
+        if self.shared:
+            resident_columns = ()
+        else:
+            resident_columns = self.RESIDENT_COLUMNS if self.lazy_columns else None
+        fuzzy_fields = sorted(self.FUZZY_MATCH_FIELDS)
+        catalog = open_catalog(filepath, exact_fields, resident_columns=resident_columns,
+                               fuzzy_fields=fuzzy_fields, supplement_path=self.supplement_path,
+                               lookup_fields=self.LOOKUP_FIELDS + (self.NAME_LOOKUP_FIELD,))
+        text_fields = [c for c in catalog.columns if c not in self.EXACT_MATCH_FIELDS]
+        state = SearchState(
+            catalog,
+            SearchIndex(catalog, text_fields, exact_fields, fuzzy_fields),
+            BM25Index(catalog, self.RANK_FIELD_WEIGHTS),
+            BM25Index(catalog, self.QUERY_FIELD_WEIGHTS),
+        )
+        self._precompute(state)
+        return state
+
+    def _precompute(self, state: SearchState) -> None:
+        """행별 결과 레코드와 category / subcategory / (category, subcategory) 응답을 미리 생성
+
+        shared 모드에서는 미리 만들지 않고 요청된 행의 레코드만 만들어 둡니다
+        (정확 매칭 조회 응답은 일반 검색 경로 + 결과 캐시가 처리).
+        """
+        if self.shared:
+            catalog = state.catalog
+            state.records = RowRecords(lambda row: self._detail(catalog, row))
+            state.summaries = RowRecords(lambda row: {
+                key: state.records[row][key] for key in ("function_name", "api_name", "category", "subcategory")
+            })
+            return
+
+        state.records = [self._detail(state.catalog, row) for row in range(state.catalog.row_count)]
+        state.summaries = [
+            {key: record[key] for key in ("function_name", "api_name", "category", "subcategory")}
+            for record in state.records
+        ]
+
+        bitmaps = state.index.bitmaps
+        payloads = {}
+        for field in sorted(self.EXACT_MATCH_FIELDS):
+            for value, mask in bitmaps.get(field, {}).items():
+                payloads[((field, value),)] = self._listing_result(state, bitmap_rows(mask))
+        if {'category', 'subcategory'} <= set(bitmaps):
+            for category, category_mask in bitmaps['category'].items():
+                for subcategory, subcategory_mask in bitmaps['subcategory'].items():
+                    rows = bitmap_rows(category_mask & subcategory_mask)
+                    if rows:
+                        payloads[(('category', category), ('subcategory', subcategory))] = self._detail_result(state, rows)
+        state.payloads = payloads
+
+    # 카탈로그 파일 변경 감시 (재시작 없이 data2.csv 갱신 반영)
+
+    def reload_if_changed(self) -> bool:
+        """CSV(+ 보조 CSV) 내용(SHA-256)이 바뀌었으면 새 인덱스를 만들어 교체"""
+        state = self._state
+        try:
+            if state is not None and catalog_version(self.filepath, self.supplement_path) == state.version:
+                return False
+        except OSError:
+            return False
+        message = self.load_data(self.filepath)
+        print(f"카탈로그 재로드: {message} (version {(self.catalog_version or '-')[:12]})", file=sys.stderr)
+        return not message.startswith("❌")
+
+    def start_watching(self, interval: float = 5.0) -> None:
+        """백그라운드 스레드에서 파일 변경을 주기적으로 확인 (쓰는 도중이면 다음 주기까지 대기)"""
+        if self._watcher is not None:
+            return
+
+        def stat_key():
+            try:
+                paths = [self.filepath] + ([self.supplement_path] if self.supplement_path else [])
+                return tuple((stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, paths))
+            except OSError:
+                return None
+
+        def run():
+            last = stat_key()
+            pending = None
+            while not self._stop_watching.wait(interval):
+                current = stat_key()
+                if current is None or current == last:
+                    pending = None
+                    continue
+                # 한 주기 동안 변화가 없을 때만 재로드 (파일을 쓰는 중일 수 있음)
+                if current != pending:
+                    pending = current
+                    continue
+                self.reload_if_changed()
+                last, pending = current, None
+
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=run, name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _listing_result(self, state: SearchState, rows: List[int], note: str = "") -> dict:
+        """단순 개수 조회 응답 (api_name 기준 중복 제거 목록)"""
+        results = []
+        seen = set()
+        for row in rows:
+            summary = state.summaries[row]
+            if summary["api_name"] in seen:
+                continue
+            seen.add(summary["api_name"])
+            results.append(summary)
+
+        return {
+            "status": "success",
+            "message": f"Found {len(rows)} APIs ({len(results)} unique)" + note,
+            "total_count": len(rows),
+            "results": results
+        }
+
+    def _detail_result(self, state: SearchState, rows: List[int], note: str = "",
+                       unverified: Set[int] = frozenset()) -> dict:
+        """상세 검색 응답 (앞에서부터 MAX_RESULTS 개, unverified 행은 response_unverified 표시)"""
+        return {
+            "status": "success",
+            "message": f"Found {len(rows)} APIs" + (f" (showing first {self.MAX_RESULTS})" if len(rows) > self.MAX_RESULTS else "") + note,
+            "total_count": len(rows),
+            "results": [dict(state.records[row], response_unverified=True) if row in unverified else state.records[row]
+                        for row in rows[:self.MAX_RESULTS]]
+        }
+
+    @staticmethod
+    def _value(catalog, row: int, column: str) -> str:
+        return catalog.value(row, column) if column in catalog.columns else ''
+
+    def _detail(self, catalog, row: int) -> dict:
+        return {
+            "function_name": self._value(catalog, row, 'function_name'),
+            "api_name": self._value(catalog, row, 'api_name'),
+            "category": self._value(catalog, row, 'category'),
+            "subcategory": self._value(catalog, row, 'subcategory'),
+            # 나머지 필드들은 주석처리
+            # "description": self._value(catalog, row, 'description'),
+            # "args": self._value(catalog, row, 'args'),
+            # "returns": self._value(catalog, row, 'returns'),
+            # "example_usage": self._value(catalog, row, 'example_usage'),
+            # "response": self._value(catalog, row, 'response'),
+            # "url_name": self._value(catalog, row, 'url_name'),
+            # "method": self._value(catalog, row, 'method'),
+            # "api_id": self._value(catalog, row, 'api_id'),
+            "url_main": self._value(catalog, row, 'url_main'),
+            "url_chk": self._value(catalog, row, 'url_chk')
+        }
+
+    def lookup(self, identifier: str) -> dict:
+        """TR ID(api_id) 또는 REST 경로(url_name)로 API 를 바로 찾음 (해시 조회, 부분 문자열 검색 없음)
+
+        전체 URL, 끝의 /, 대소문자 차이는 무시합니다.
+        """
+        with self._holding_state() as state:
+            return self._lookup(state, identifier)
+
+    def _lookup(self, state: Optional[SearchState], identifier: str) -> dict:
+        if state is None:
             return {
                 "status": "error",
                 "message": "Data not loaded",
                 "total_count": 0,
                 "results": []
             }
-        
+        identifier = identifier.strip() if isinstance(identifier, str) else ""
+        if not identifier:
+            return {
+                "status": "error",
+                "message": "No identifier given",
+                "total_count": 0,
+                "results": []
+            }
+
+        for field in self.LOOKUP_FIELDS:
+            rows = list(state.catalog.lookup(field, identifier))
+            if rows:
+                return {
+                    "status": "success",
+                    "message": f"Found {len(rows)} APIs by {field}",
+                    "total_count": len(rows),
+                    "results": [self._lookup_record(state, row) for row in rows],
+                    "catalog_version": state.version[:12],
+                }
+        return {
+            "status": "no_results",
+            "message": f"No API with TR ID or REST path: {identifier}",
+            "total_count": 0,
+            "results": [],
+            "catalog_version": state.version[:12],
+        }
+
+    def parameters(self, function_names: List[str], category: Optional[str] = None) -> dict:
+        """함수명 여러 개의 파라미터 명세 (name, type, required, description, example, default)
+
+        카탈로그 빌드 시 args 컬럼을 파싱해 둔 명세를 해시 조회로 바로 반환합니다 (GitHub 조회 없음).
+        같은 함수명이 여러 카테고리에 있으면 category 로 거르고, 없으면 모두 반환합니다.
+        """
+        with self._holding_state() as state:
+            return self._parameters(state, function_names, category)
+
+    def _parameters(self, state: Optional[SearchState], function_names: List[str],
+                    category: Optional[str]) -> dict:
+        if state is None:
+            return {
+                "status": "error",
+                "message": "Data not loaded",
+                "total_count": 0,
+                "results": [],
+                "not_found": []
+            }
+
+        catalog = state.catalog
+        results = []
+        not_found = []
+        for name in function_names:
+            name = name.strip() if isinstance(name, str) else ""
+            rows = [row for row in catalog.lookup(self.NAME_LOOKUP_FIELD, name)
+                    if not category or catalog.value(row, 'category') == category] if name else []
+            if not rows:
+                not_found.append(name)
+                continue
+            for row in rows:
+                record = state.records[row]
+                results.append({
+                    **{key: record[key] for key in ("function_name", "api_name", "category", "subcategory")},
+                    "parameters": state.arg_specs[row],
+                })
+
+        if not results:
+            status = "no_results"
+        elif not_found:
+            status = "partial_success"
+        else:
+            status = "success"
+        return {
+            "status": status,
+            "message": f"Found parameters for {len(results)} APIs"
+                       + (f" (not found: {', '.join(not_found)})" if not_found else ""),
+            "total_count": len(results),
+            "results": results,
+            "not_found": not_found,
+            "catalog_version": state.version[:12],
+        }
+
+    def _lookup_record(self, state: SearchState, row: int) -> dict:
+        catalog = state.catalog
+        return {
+            **state.records[row],
+            "api_id": self._value(catalog, row, 'api_id'),
+            "url_name": self._value(catalog, row, 'url_name'),
+            "method": self._value(catalog, row, 'method'),
+            "communication": self._value(catalog, row, 'communication'),
+        }
+
+    @staticmethod
+    def _order(state: SearchState, rows, query: Optional[str]) -> List[int]:
+        """query 가 있으면 관련도 순(동점이면 카탈로그 순), 없으면 카탈로그 순"""
+        if not query:
+            return sorted(rows)
+        scores = state.query_ranker.scores(query, set(rows))
+        return sorted(rows, key=lambda row: (-scores.get(row, 0.0), row))
+
+    def _cache_key(self, state: SearchState, query: Optional[str], ranked: bool,
+                   kwargs: Dict[str, Any]) -> tuple:
+        """정규화된 검색 조건 키 (대소문자 무시 필드만 소문자로, 정규식 패턴은 그대로)"""
+        def fold(key, value):
+            if not isinstance(value, str) or key in self.EXACT_MATCH_FIELDS:
+                return value
+            if any(ch in REGEX_META_CHARS for ch in value):
+                return value
+            return value.lower()
+
+        params = tuple(sorted((k, fold(k, v)) for k, v in kwargs.items()))
+        return (state.version, fold('query', query), bool(ranked), params)
+
+    def search(self, query: Optional[str] = None, ranked: bool = False, **kwargs) -> dict:
+        """통합 API 검색 (결과 캐시 적용, 문자열 조건은 앞뒤 공백 제거)
+
+        응답의 catalog_version 은 검색에 사용한 카탈로그 버전(CSV SHA-256, 보조 CSV 가 있으면 합친 해시) 앞 12자리입니다.
+        """
+        # 재로드와 무관하게 이 호출은 시작 시점의 상태 하나만 사용
+        with self._holding_state() as state:
+            return self._cached_search(state, query, ranked, kwargs)
+
+    def _cached_search(self, state: Optional[SearchState], query: Optional[str], ranked: bool,
+                       kwargs: Dict[str, Any]) -> dict:
+        if state is None:
+            return {
+                "status": "error",
+                "message": "Data not loaded",
+                "total_count": 0,
+                "results": []
+            }
+
+        query = query.strip() if isinstance(query, str) else query
+        kwargs = {k: (v.strip() if isinstance(v, str) else v) for k, v in kwargs.items() if v is not None}
+        key = self._cache_key(state, query, ranked, kwargs)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._search(state, query, ranked, **kwargs)
+            self.cache.put(key, result)
+        # 호출 측에서 결과를 수정해도 캐시가 바뀌지 않도록 복사
+        return {
+            **result,
+            "results": [dict(item) for item in result["results"]],
+            "catalog_version": state.version[:12],
+        }
+
+    def _search(self, state: SearchState, query: Optional[str] = None, ranked: bool = False, **kwargs) -> dict:
+        """통합 API 검색 (성능 최적화)
+
+        ranked=True 이면 category/subcategory 는 필터로, 나머지 텍스트 조건은 BM25 질의어로 사용해
+        관련도 순 상위 MAX_RESULTS 개를 score 와 함께 반환합니다.
+
+        query(사용자 원문 질문)가 있으면:
+        - 다른 조건이 category 뿐이면 모든 텍스트 컬럼에 대한 자유 검색 (관련도 순)
+        - 다른 조건이 있으면 기존 검색 결과를 query 관련도 순으로 정렬하고,
+          결과가 없으면 query + 조건 텍스트로 자유 검색
+        """
+        query = query.strip() if query else None
+        if kwargs.get(self.OUTPUT_FIELD_PARAM):
+            return self._field_search(state, kwargs.pop(self.OUTPUT_FIELD_PARAM), kwargs, query)
+
+        ranker = state.query_ranker if query else state.ranker
+        terms = " ".join([query or ""] + [str(v) for k, v in kwargs.items()
+                                          if v is not None and k not in self.EXACT_MATCH_FIELDS]).strip()
+
+        # 랭킹할 텍스트가 없으면 일반 검색과 동일
+        if ranked and terms:
+            return self._ranked_search(state, terms, kwargs, ranker)
+
         # 실제 사용되는 파라미터만 필터링
-        valid_kwargs = {k: v for k, v in kwargs.items() 
-                       if v is not None and k in self._data.columns}
-        
+        valid_kwargs = {k: v for k, v in kwargs.items()
+                       if v is not None and k in state.catalog.columns}
+
+        if query and not set(valid_kwargs) - {'category'}:
+            return self._ranked_search(state, terms, kwargs, ranker)
+
         if not valid_kwargs:
             return {
-                "status": "error", 
+                "status": "error",
                 "message": "No valid search parameters",
                 "total_count": 0,
                 "results": []
             }
-        
-        # 인덱스 기반 필터링 (복사 없이)
-        mask = pd.Series(True, index=self._data.index)
-        
+
+        # category / subcategory 만으로 된 조회는 미리 만든 응답 사용
+        if not query and set(valid_kwargs) <= self.EXACT_MATCH_FIELDS:
+            payload = state.payloads.get(tuple(sorted(valid_kwargs.items())))
+            if payload is not None:
+                return payload
+
+        # 정확 매칭 비트맵 AND 로 후보를 먼저 줄인 뒤 역색인으로 부분 매칭
+        # (매칭이 없으면 FUZZY_MATCH_FIELDS 는 오타 허용 검색으로 재시도)
+        index = state.index
+        mask = index.all_rows
+        fuzzy_matched = []
+
+        for key in sorted(self.EXACT_MATCH_FIELDS):
+            if key in valid_kwargs:
+                matched = mask & index.equals_mask(key, valid_kwargs[key])
+                if not matched and key in self.FUZZY_MATCH_FIELDS:
+                    fuzzy_rows = index.fuzzy_match(key, valid_kwargs[key], bitmap_rows(mask))
+                    matched = to_bitmap(fuzzy_rows, state.catalog.row_count)
+                    if matched:
+                        fuzzy_matched.append(key)
+                mask = matched
+
+        rows = set(bitmap_rows(mask))
+        # 보조 컬럼 조건을 확인할 수 없어(값 없음) 통과시킨 행
+        unverified: Set[int] = set()
+
         for key, value in valid_kwargs.items():
-            if key in self.EXACT_MATCH_FIELDS:
-                mask &= (self._data[key] == value)
-            else:
-                mask &= self._data[key].astype(str).str.contains(
-                    str(value), case=False, na=False
-                )
-        
-        result = self._data[mask]
-        
-        if result.empty:
+            if key not in self.EXACT_MATCH_FIELDS:
+                if not rows:
+                    break
+                matched, unknown = self._contains(index, key, value, rows)
+                if not matched and not unknown and key in self.FUZZY_MATCH_FIELDS:
+                    matched = index.fuzzy_match(key, value, rows)
+                    if matched:
+                        fuzzy_matched.append(key)
+                rows = matched | unknown
+                unverified = (unverified & rows) | unknown
+
+        # 확인된 행을 먼저, 확인하지 못한 행은 그 뒤에
+        result = self._order(state, rows - unverified, query) + self._order(state, unverified, query)
+        fuzzy_note = f" (fuzzy match: {', '.join(fuzzy_matched)})" if fuzzy_matched else ""
+
+        if not result:
+            if query:
+                return self._ranked_search(state, terms, kwargs, ranker,
+                                           f"No APIs found with conditions: {valid_kwargs}; ")
             return {
                 "status": "no_results",
                 "message": f"No APIs found with conditions: {valid_kwargs}",
                 "total_count": 0,
                 "results": []
             }
-        
+
         # 특별 케이스: 단순 개수 조회 (category 또는 subcategory만 있을 때)
-        if (len(valid_kwargs) == 1 and 
+        if (len(valid_kwargs) == 1 and
             ('category' in valid_kwargs or 'subcategory' in valid_kwargs)):
-            
-            # 간단한 리스트만 반환 (schema 일관성 유지)
-            unique_apis = result.drop_duplicates(subset=['api_name'])
-            results = []
-            for _, api in unique_apis.iterrows():
-                results.append({
-                    "function_name": api['function_name'],
-                    "api_name": api['api_name'],
-                    "category": api['category'],
-                    "subcategory": api['subcategory']
-                })
-            
+            # 간단한 리스트만 반환 (schema 일관성 유지, api_name 기준 중복 제거)
+            return self._listing_result(state, result, fuzzy_note)
+
+        # 일반 상세 검색 결과
+        return self._detail_result(state, result, fuzzy_note, unverified)
+
+    def _contains(self, index: SearchIndex, key: str, value: str, rows: Set[int]) -> Tuple[Set[int], Set[int]]:
+        """(부분 매칭 행, 확인할 수 없는 행)
+
+        보조 컬럼은 대체 컬럼에서 찾은 행도 매칭으로 보고, 어디에도 없으면서 보조 컬럼 값이 비어 있는 행
+        (data.csv 에 없는 API)은 확인할 수 없는 행으로 따로 돌려줍니다.
+        """
+        matched = index.contains(key, value, rows)
+        if key not in self.SUPPLEMENT_FALLBACK_FIELDS:
+            return matched, set()
+        rest = rows - matched
+        for fallback in self.SUPPLEMENT_FALLBACK_FIELDS[key]:
+            if rest and fallback in index.text:
+                found = index.contains(fallback, value, rest)
+                matched |= found
+                rest -= found
+        column = index.text[key]
+        return matched, {row for row in rest if not column.text(row)}
+
+    @staticmethod
+    def _field_keys(catalog, name: str, scope: Set[int]) -> Tuple[Set[Tuple[str, str]], Set[int], bool]:
+        """응답 필드 이름 하나 -> (매칭된 (code|label, 정규화 키), scope 안의 행 번호, 부분 일치 여부)
+
+        scope 안에 코드 / 한글 이름이 정확히 일치하는 행이 없으면 이름을 포함하는 키로 다시 찾습니다
+        (색인 키 목록만 확인, column_mapping 본문은 읽지 않음).
+        """
+        key = normalize_field_key(name)
+        keys: Set[Tuple[str, str]] = set()
+        rows: Set[int] = set()
+        for kind in ("code", "label"):
+            matched = scope.intersection(catalog.field_rows(kind, key))
+            if matched:
+                keys.add((kind, key))
+                rows |= matched
+        if rows:
+            return keys, rows, False
+
+        for kind in ("code", "label"):
+            for candidate, matched in catalog.postings(f"field:{kind}").items():
+                if key in candidate:
+                    matched = scope.intersection(matched)
+                    if matched:
+                        keys.add((kind, candidate))
+                        rows |= matched
+        return keys, rows, True
+
+    def _field_search(self, state: SearchState, text: str, filters: Dict[str, Any],
+                      query: Optional[str]) -> dict:
+        """응답 필드 역색인 검색: 쉼표로 구분한 필드를 모두 반환하는 API (matched_fields 에 매칭된 필드 표시)
+
+        category / subcategory 는 필터, 나머지 조건은 부분 매칭으로 후보를 줄이고,
+        query 가 있으면 관련도 순으로 정렬합니다.
+        """
+        catalog = state.catalog
+        names = [name.strip() for name in str(text).split(",") if name.strip()]
+        if not names or catalog.field_column is None:
             return {
-                "status": "success",
-                "message": f"Found {len(result)} APIs ({len(results)} unique)",
-                "total_count": len(result),
-                "results": results
+                "status": "error",
+                "message": "No response field given" if catalog.field_column is not None else "Catalog has no column_mapping",
+                "total_count": 0,
+                "results": []
             }
-        
-        # 일반 상세 검색 결과
+
+        index = state.index
+        mask = index.all_rows
+        for key in sorted(self.EXACT_MATCH_FIELDS):
+            if filters.get(key) is not None:
+                mask &= index.equals_mask(key, filters[key])
+        rows = set(bitmap_rows(mask))
+        for key, value in filters.items():
+            if key not in self.EXACT_MATCH_FIELDS and key in catalog.columns and rows:
+                rows = index.contains(key, value, rows)
+
+        keys: Set[Tuple[str, str]] = set()
+        partial = []
+        for name in names:
+            if not rows:
+                break
+            name_keys, rows, is_partial = self._field_keys(catalog, name, rows)
+            keys |= name_keys
+            if is_partial and rows:
+                partial.append(name)
+
+        if not rows:
+            return {
+                "status": "no_results",
+                "message": f"No APIs return fields: {', '.join(names)}" + (f" with conditions: {filters}" if filters else ""),
+                "total_count": 0,
+                "results": []
+            }
+
+        ordered = self._order(state, rows, query)
         results = []
-        for _, api in result.head(self.MAX_RESULTS).iterrows():
-            results.append({
-                "function_name": api['function_name'],
-                "api_name": api['api_name'],
-                "category": api['category'],
-                "subcategory": api['subcategory'],
-                # 나머지 필드들은 주석처리
-                # "description": api['description'],
-                # "args": api.get('args', ''),
-                # "returns": api.get('returns', ''),
-                # "example_usage": api.get('example_usage', ''),
-                # "response": api.get('response', ''),
-                # "url_name": api.get('url_name', ''),
-                # "method": api.get('method', ''),
-                # "api_id": api.get('api_id', ''),
-                "url_main": api.get('url_main', ''),
-                "url_chk": api.get('url_chk', '')
-            })
-        
+        for row in ordered[:self.MAX_RESULTS]:
+            matched_fields = [
+                {"field": code, "label": label} for code, label, code_key, label_key in state.response_fields[row]
+                if ("code", code_key) in keys or ("label", label_key) in keys
+            ]
+            results.append({**state.records[row], "matched_fields": matched_fields})
+
+        partial_note = f" (partial match: {', '.join(partial)})" if partial else ""
+        return {
+            "status": "success",
+            "message": f"Found {len(rows)} APIs returning {', '.join(names)}"
+                       + (f" (showing first {self.MAX_RESULTS})" if len(rows) > self.MAX_RESULTS else "") + partial_note,
+            "total_count": len(rows),
+            "results": results
+        }
+
+    def _ranked_search(self, state: SearchState, terms: str, kwargs: Dict[str, Any],
+                       ranker: BM25Index, note: str = "") -> dict:
+        """BM25 관련도 검색 (정확 매칭 필드는 후보 필터로만 사용)"""
+        mask = None
+        for key in self.EXACT_MATCH_FIELDS:
+            value = kwargs.get(key)
+            if value is not None and key in state.catalog.columns:
+                matched = state.index.equals_mask(key, value)
+                mask = matched if mask is None else mask & matched
+
+        rows = None if mask is None else set(bitmap_rows(mask))
+        scores = ranker.scores(terms, rows)
+        if not scores:
+            return {
+                "status": "no_results",
+                "message": f"{note}No APIs matched query terms: {terms}",
+                "total_count": 0,
+                "results": []
+            }
+
+        results = []
+        for row, score in top_k(scores, self.MAX_RESULTS):
+            results.append({**state.records[row], "score": round(score, 4)})
+
         return {
             "status": "success",
-            "message": f"Found {len(result)} APIs" + (f" (showing first {self.MAX_RESULTS})" if len(result) > self.MAX_RESULTS else ""),
-            "total_count": len(result),
+            "message": f"{note}Found {len(scores)} APIs ranked by relevance" + (f" (showing top {self.MAX_RESULTS})" if len(scores) > self.MAX_RESULTS else ""),
+            "total_count": len(scores),
             "results": results
         }
@@ -0,0 +1,812 @@
+"""API 카탈로그 로드 / 컴파일
+
+data2.csv 를 매번 파싱하는 대신, 문자열 테이블 + 셀 참조 + 사전 계산 postings 를 담은
+바이너리 카탈로그(.kiscat)로 컴파일해 두고 mmap 으로 읽습니다.
+보조 CSV(data.csv)가 주어지면 data2.csv 에 없는 컬럼(TR ID, REST 경로, 응답 필드 등)을
+(category, function_name) 기준으로 붙여 하나의 카탈로그로 만듭니다.
+
+파일 구조:
+    MAGIC(8) | header_len(uint32 LE) | header(JSON) | padding | sections...
+
+    strings   : uint32 count | uint32 offsets[count + 1] | UTF-8 blob   (중복 제거된 셀 문자열)
+    cells     : uint32 string_id[row_count * column_count]
+    postings  : uint32 key_count | uint32 key_offsets[n + 1] | uint32 row_offsets[n + 1]
+                | uint32 rows[...] | UTF-8 key blob (키는 UTF-8 바이트 순 정렬)
+    array     : uint32 values[...]   (BM25 문서 길이 등)
+    specs     : strings 와 같은 형식, 행마다 args 를 파싱한 파라미터 명세 JSON 하나
+    hash      : uint32 slot_count | uint32 slots[slot_count]   (postings 키 crc32 -> 키 번호 + 1, 선형 탐사)
+
+postings 종류: exact:{컬럼}, text:{컬럼}:chars|grams|words|tf, fuzzy:{컬럼}(자모 trigram),
+               lookup:{컬럼}(정규화한 TR ID / REST 경로, hash 섹션으로 O(1) 조회),
+               field:code|label(column_mapping 의 응답 필드 코드 / 한글 이름 -> 행, hash 섹션 포함)
+
+사용법:
+    python -m src.utils.catalog build [--csv data2.csv] [--supplement data.csv] [--out data2.kiscat]
+    python -m src.utils.catalog bench [--csv data2.csv] [--runs 5]
+    python -m src.utils.catalog bench-filters [--csv data2.csv] [--runs 2000]
+"""
+import argparse
+import array
+import ast
+import csv
+import hashlib
+import json
+import mmap
+import os
+import re
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import zlib
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.utils.fuzzy import build_fuzzy_postings
+from src.utils.search_index import build_exact_postings, build_text_postings
+
+FORMAT_VERSION = 7
+MAGIC = b"KISCAT\x00\x01"
+CATALOG_SUFFIX = ".kiscat"
+EXACT_FIELDS = ("category", "subcategory")
+FUZZY_FIELDS = ("api_name", "description", "function_name", "subcategory")
+LOOKUP_FIELDS = ("api_id", "url_name", "function_name")
+# 보조 CSV(data.csv)에서 가져오는 컬럼과 조인 키
+SUPPLEMENT_COLUMNS = ("communication", "method", "url_name", "api_id", "response", "example_question")
+JOIN_KEY = ("category", "function_name")
+# 응답 필드 역색인을 만드는 컬럼 ({'응답 코드': '한글 이름', ...} 형태)
+FIELD_COLUMN = "column_mapping"
+# 파라미터 명세를 만드는 컬럼 ("name (type): [필수] 설명 (ex. 예시)" 줄 목록)
+SPEC_COLUMN = "args"
+# hash 섹션을 함께 만드는 postings (정확한 키로만 조회)
+HASHED_POSTINGS = ("lookup:", "field:")
+
+
+def _align(offset: int, size: int = 8) -> int:
+    return (offset + size - 1) // size * size
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def catalog_version(csv_path: str, supplement_path: Optional[str] = None) -> str:
+    """카탈로그 버전: CSV SHA-256 (보조 CSV 가 있으면 두 파일 해시를 합친 SHA-256)"""
+    version = file_sha256(csv_path)
+    if supplement_path is None:
+        return version
+    return hashlib.sha256(f"{version}:{file_sha256(supplement_path)}".encode("ascii")).hexdigest()
+
+
+def compiled_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + CATALOG_SUFFIX
+
+
+def read_csv_columns(csv_path: str) -> Dict[str, List[str]]:
+    """CSV 를 컬럼별 문자열 리스트로 읽음 (빈 셀은 빈 문자열)"""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        columns: Dict[str, List[str]] = {name: [] for name in header}
+        for record in reader:
+            for name, value in zip(header, record):
+                columns[name].append(value)
+    return columns
+
+
+def merge_supplement(columns: Dict[str, List[str]], supplement: Dict[str, List[str]],
+                     extra_columns: Iterable[str] = SUPPLEMENT_COLUMNS) -> Dict[str, List[str]]:
+    """보조 CSV 의 컬럼을 JOIN_KEY 기준으로 붙임 (짝이 없는 행은 빈 문자열, 앞뒤 공백 제거)"""
+    extra_columns = [name for name in extra_columns if name in supplement and name not in columns]
+    position = {key: i for i, key in enumerate(zip(*(supplement[name] for name in JOIN_KEY)))}
+    rows = [position.get(key) for key in zip(*(columns[name] for name in JOIN_KEY))]
+    merged = dict(columns)
+    for name in extra_columns:
+        values = supplement[name]
+        merged[name] = ["" if row is None else values[row].strip() for row in rows]
+    return merged
+
+
+def read_catalog_columns(csv_path: str, supplement_path: Optional[str] = None) -> Dict[str, List[str]]:
+    columns = read_csv_columns(csv_path)
+    if supplement_path is not None:
+        columns = merge_supplement(columns, read_csv_columns(supplement_path))
+    return columns
+
+
+def normalize_lookup_key(value: str) -> str:
+    """TR ID / REST 경로 조회 키 정규화 (대소문자, 앞뒤 공백, 전체 URL 의 호스트 / 쿼리, 끝의 / 무시)"""
+    key = value.strip()
+    if "://" in key:
+        key = "/" + key.split("://", 1)[1].partition("/")[2]
+    key = key.split("?", 1)[0].split("#", 1)[0]
+    if len(key) > 1:
+        key = key.rstrip("/")
+    return key.lower()
+
+
+def build_lookup_postings(values: Iterable[str]) -> Dict[str, List[int]]:
+    """정규화한 값 -> 행 번호 (빈 값 제외)"""
+    postings: Dict[str, List[int]] = {}
+    for row, value in enumerate(values):
+        key = normalize_lookup_key(value)
+        if key:
+            postings.setdefault(key, []).append(row)
+    return postings
+
+
+def parse_column_mapping(text: str) -> Dict[str, str]:
+    """column_mapping 셀 -> {응답 코드: 한글 이름} (형식이 다르면 빈 dict)"""
+    try:
+        mapping = ast.literal_eval(text.strip()) if text.strip() else {}
+    except (ValueError, SyntaxError):
+        return {}
+    if not isinstance(mapping, dict):
+        return {}
+    return {str(code): str(label) for code, label in mapping.items()}
+
+
+def normalize_field_key(value: str) -> str:
+    """응답 필드 조회 키 정규화 (대소문자, 공백 무시: '전일 대비 부호' == '전일대비부호')"""
+    return "".join(value.split()).lower()
+
+
+def build_field_postings(values: Iterable[str]) -> Dict[str, Dict[str, List[int]]]:
+    """column_mapping 컬럼 -> {"code": 코드 -> 행, "label": 한글 이름 -> 행}"""
+    postings: Dict[str, Dict[str, List[int]]] = {"code": {}, "label": {}}
+    for row, value in enumerate(values):
+        for code, label in parse_column_mapping(value).items():
+            for kind, key in (("code", normalize_field_key(code)), ("label", normalize_field_key(label))):
+                if not key:
+                    continue
+                rows = postings[kind].setdefault(key, [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+    return postings
+
+
+_ARG_LINE = re.compile(r"^\s*(\*{0,2}[A-Za-z_]\w*)\s*(?:\(([^()]*)\))?\s*:\s*(.*)$")
+# (ex. 값) / (ex 값) / (ex) 값) / (예: 값) 형태, 닫는 괄호가 빠진 마지막 예시도 허용
+_ARG_EXAMPLE = re.compile(r"\s*\((?:ex[.)]|ex(?=\s)|예:|예시:|e\.g\.)\s*([^()]*(?:\([^()]*\)[^()]*)*)(?:\)|$)")
+_ARG_DEFAULT = re.compile(r"\s*(?:\(기본값:\s*([^()]*)\)|Defaults to\s+(.+?)\.?$)")
+_ARG_MARKER = re.compile(r"\s*\[(필수|선택)\]\s*")
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def parse_arg_specs(text: str) -> List[Dict[str, object]]:
+    """args 셀 -> [{name, type, required, description, example, default}]
+
+    required 는 [필수] / [선택] 표시를 따르고, 표시가 없으면 Optional 타입이나 기본값이 있을 때만 False 입니다.
+    형식에 맞지 않는 줄은 앞 파라미터 설명의 이어지는 줄로 붙입니다.
+    """
+    specs: List[Dict[str, object]] = []
+    for line in text.splitlines():
+        match = _ARG_LINE.match(line)
+        if match is None:
+            if specs and line.strip():
+                specs[-1]["description"] = f"{specs[-1]['description']}\n{line.strip()}".strip()
+            continue
+        name, type_, description = match.group(1), (match.group(2) or "").strip(), match.group(3).strip()
+
+        marker = _ARG_MARKER.search(description)
+        description = _ARG_MARKER.sub(" ", description).strip()
+        example = _ARG_EXAMPLE.search(description)
+        description = _ARG_EXAMPLE.sub("", description).strip()
+        default = _ARG_DEFAULT.search(description)
+        description = _ARG_DEFAULT.sub("", description).strip()
+
+        optional = type_.endswith(", optional")
+        type_ = type_[:-len(", optional")] if optional else type_
+        if marker is not None:
+            required = marker.group(1) == "필수"
+        else:
+            required = not (optional or type_.startswith("Optional[") or default is not None or name.startswith("*"))
+        specs.append({
+            "name": name,
+            "type": type_ or None,
+            "required": required,
+            "description": description,
+            "example": _unquote(example.group(1)) if example is not None else None,
+            "default": _unquote(default.group(1) if default.group(1) is not None else default.group(2))
+            if default is not None else None,
+        })
+    return specs
+
+
+# 메모리 카탈로그 (CSV 직접 로드, 컴파일 입력으로도 사용)
+
+class MemoryCatalog:
+    """CSV 에서 바로 만든 카탈로그 (postings 도 메모리에서 생성)"""
+
+    def __init__(self, columns: Dict[str, List[str]], version: str,
+                 exact_fields: Iterable[str] = EXACT_FIELDS,
+                 fuzzy_fields: Iterable[str] = FUZZY_FIELDS,
+                 lookup_fields: Iterable[str] = LOOKUP_FIELDS):
+        self.columns: List[str] = list(columns)
+        self.row_count = len(next(iter(columns.values()), []))
+        self.version = version
+        self.exact_fields = [name for name in exact_fields if name in columns]
+        self.fuzzy_fields = [name for name in fuzzy_fields if name in columns]
+        self.lookup_fields = [name for name in lookup_fields if name in columns]
+        self.field_column = FIELD_COLUMN if FIELD_COLUMN in columns else None
+        self.spec_column = SPEC_COLUMN if SPEC_COLUMN in columns else None
+        self._data = columns
+        self._specs = [parse_arg_specs(value) for value in columns[self.spec_column]] if self.spec_column else []
+        self._postings: Dict[str, Mapping] = {}
+        self._arrays: Dict[str, List[int]] = {}
+
+        for name in self.columns:
+            if name in self.exact_fields:
+                self._postings[f"exact:{name}"] = build_exact_postings(columns[name])
+            else:
+                tables, doc_lengths = build_text_postings(columns[name])
+                for kind, table in tables.items():
+                    self._postings[f"text:{name}:{kind}"] = table
+                self._arrays[f"doclen:{name}"] = doc_lengths
+        for name in self.fuzzy_fields:
+            self._postings[f"fuzzy:{name}"] = build_fuzzy_postings(columns[name])
+        for name in self.lookup_fields:
+            self._postings[f"lookup:{name}"] = build_lookup_postings(columns[name])
+        if self.field_column is not None:
+            for kind, table in build_field_postings(columns[self.field_column]).items():
+                self._postings[f"field:{kind}"] = table
+
+    @classmethod
+    def from_csv(cls, csv_path: str, exact_fields: Iterable[str] = EXACT_FIELDS,
+                 fuzzy_fields: Iterable[str] = FUZZY_FIELDS,
+                 supplement_path: Optional[str] = None) -> "MemoryCatalog":
+        return cls(read_catalog_columns(csv_path, supplement_path), catalog_version(csv_path, supplement_path),
+                   exact_fields, fuzzy_fields)
+
+    def value(self, row: int, column: str) -> str:
+        return self._data[column][row]
+
+    def postings(self, name: str) -> Mapping:
+        return self._postings[name]
+
+    def lookup(self, field: str, key: str) -> Sequence[int]:
+        """TR ID / REST 경로 등 조회 키 -> 행 번호 (dict 조회 한 번)"""
+        if field not in self.lookup_fields:
+            return ()
+        return self._postings[f"lookup:{field}"].get(normalize_lookup_key(key), ())
+
+    def field_rows(self, kind: str, key: str) -> Sequence[int]:
+        """응답 필드 코드(kind="code") / 한글 이름(kind="label") -> 행 번호"""
+        if self.field_column is None:
+            return ()
+        return self._postings[f"field:{kind}"].get(normalize_field_key(key), ())
+
+    def arg_specs(self, row: int) -> List[Dict[str, object]]:
+        """행의 파라미터 명세 (빌드 시 파싱)"""
+        return self._specs[row] if self.spec_column else []
+
+    def postings_names(self) -> List[str]:
+        return list(self._postings)
+
+    def array(self, name: str) -> Sequence[int]:
+        return self._arrays[name]
+
+    def array_names(self) -> List[str]:
+        return list(self._arrays)
+
+    def close(self) -> None:
+        """닫을 파일 없음 (MappedCatalog 와 같은 인터페이스)"""
+
+
+# 바이너리 카탈로그 쓰기
+
+def _u32(values: Iterable[int]) -> bytes:
+    return array.array("I", values).tobytes()
+
+
+def _pack_strings(strings: Sequence[str]) -> bytes:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    return _u32([len(encoded)]) + _u32(offsets) + b"".join(encoded)
+
+
+def _pack_hash(postings: Mapping) -> bytes:
+    """postings 키 -> 키 번호 해시 테이블 (_pack_postings 의 키 순서, 적재율 0.5 이하)"""
+    keys = sorted(key.encode("utf-8") for key in postings)
+    size = 1
+    while size < 2 * len(keys):
+        size *= 2
+    slots = [0] * size
+    for index, key in enumerate(keys):
+        slot = zlib.crc32(key) & (size - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = index + 1
+    return _u32([size]) + _u32(slots)
+
+
+def _pack_postings(postings: Mapping) -> bytes:
+    items = sorted(((key.encode("utf-8"), rows) for key, rows in postings.items()), key=lambda kv: kv[0])
+    key_offsets = [0]
+    row_offsets = [0]
+    rows: List[int] = []
+    for key, key_rows in items:
+        key_offsets.append(key_offsets[-1] + len(key))
+        rows.extend(key_rows)
+        row_offsets.append(len(rows))
+    return (_u32([len(items)]) + _u32(key_offsets) + _u32(row_offsets) + _u32(rows)
+            + b"".join(key for key, _ in items))
+
+
+def write_catalog(catalog: MemoryCatalog, out_path: str) -> None:
+    """메모리 카탈로그를 바이너리 파일로 저장 (임시 파일 작성 후 rename)"""
+    interned: Dict[str, int] = {}
+    strings: List[str] = []
+    cells: List[int] = []
+    for row in range(catalog.row_count):
+        for name in catalog.columns:
+            value = catalog.value(row, name)
+            if value not in interned:
+                interned[value] = len(strings)
+                strings.append(value)
+            cells.append(interned[value])
+
+    sections = {"strings": _pack_strings(strings), "cells": _u32(cells)}
+    if catalog.spec_column is not None:
+        sections[f"specs:{catalog.spec_column}"] = _pack_strings([
+            json.dumps(catalog.arg_specs(row), ensure_ascii=False) for row in range(catalog.row_count)
+        ])
+    for name in catalog.postings_names():
+        sections[f"postings:{name}"] = _pack_postings(catalog.postings(name))
+        if name.startswith(HASHED_POSTINGS):
+            sections[f"hash:{name}"] = _pack_hash(catalog.postings(name))
+    for name in catalog.array_names():
+        sections[f"array:{name}"] = _u32(catalog.array(name))
+
+    layout = {}
+    offset = 0
+    for name, data in sections.items():
+        offset = _align(offset)
+        layout[name] = [offset, len(data)]
+        offset += len(data)
+
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "version": catalog.version,
+        "columns": catalog.columns,
+        "row_count": catalog.row_count,
+        "exact_fields": catalog.exact_fields,
+        "fuzzy_fields": catalog.fuzzy_fields,
+        "lookup_fields": catalog.lookup_fields,
+        "field_column": catalog.field_column,
+        "spec_column": catalog.spec_column,
+        "sections": layout,
+    }, ensure_ascii=False).encode("utf-8")
+    data_start = _align(len(MAGIC) + 4 + len(header))
+
+    # 예측할 수 없는 이름의 임시 파일에 쓴 뒤 rename (다른 사용자가 미리 만들어 둔 파일에 쓰지 않도록)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(out_path)),
+                                    prefix=f".{os.path.basename(out_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for name, data in sections.items():
+                f.seek(data_start + layout[name][0])
+                f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def compile_catalog(csv_path: str, out_path: Optional[str] = None,
+                    exact_fields: Iterable[str] = EXACT_FIELDS,
+                    fuzzy_fields: Iterable[str] = FUZZY_FIELDS,
+                    supplement_path: Optional[str] = None) -> str:
+    out_path = out_path or compiled_path_for(csv_path)
+    write_catalog(MemoryCatalog.from_csv(csv_path, exact_fields, fuzzy_fields, supplement_path), out_path)
+    return out_path
+
+
+# 바이너리 카탈로그 읽기 (mmap)
+
+class _StringTable:
+    """mmap 위의 문자열 테이블 (조회 시점에 디코딩)"""
+
+    def __init__(self, view: memoryview, file_offset: int):
+        count = view[:4].cast("I")[0]
+        self._offsets = view[4:4 + 4 * (count + 1)].cast("I")
+        self._blob = view[4 + 4 * (count + 1):]
+        self._blob_offset = file_offset + 4 + 4 * (count + 1)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def pread(self, fd: int, index: int) -> str:
+        """mmap 페이지를 건드리지 않고 파일 오프셋에서 직접 읽음"""
+        start = self._offsets[index]
+        return os.pread(fd, self._offsets[index + 1] - start, self._blob_offset + start).decode("utf-8")
+
+
+class MappedPostings(Mapping):
+    """mmap 위의 postings 테이블 (키 바이트 이진 탐색, 행 번호는 복사 없이 memoryview 로 반환)
+
+    hash 섹션이 있으면 이진 탐색 대신 해시 슬롯을 조회합니다.
+    """
+
+    def __init__(self, view: memoryview, hash_view: Optional[memoryview] = None):
+        count = view[:4].cast("I")[0]
+        pos = 4
+        self._key_offsets = view[pos:pos + 4 * (count + 1)].cast("I")
+        pos += 4 * (count + 1)
+        self._row_offsets = view[pos:pos + 4 * (count + 1)].cast("I")
+        pos += 4 * (count + 1)
+        total = self._row_offsets[count]
+        self._rows = view[pos:pos + 4 * total].cast("I")
+        self._keys = view[pos + 4 * total:]
+        self._count = count
+        self._slots = hash_view[4:].cast("I") if hash_view is not None else None
+
+    def _key(self, index: int) -> bytes:
+        return bytes(self._keys[self._key_offsets[index]:self._key_offsets[index + 1]])
+
+    def _find(self, key: bytes) -> int:
+        if self._slots is not None:
+            return self._probe(key)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._count and self._key(lo) == key else -1
+
+    def _probe(self, key: bytes) -> int:
+        mask = len(self._slots) - 1
+        slot = zlib.crc32(key) & mask
+        while self._slots[slot]:
+            index = self._slots[slot] - 1
+            if self._key(index) == key:
+                return index
+            slot = (slot + 1) & mask
+        return -1
+
+    def __getitem__(self, key: str) -> Sequence[int]:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        index = self._find(key.encode("utf-8"))
+        if index < 0:
+            raise KeyError(key)
+        return self._rows[self._row_offsets[index]:self._row_offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key(index).decode("utf-8")
+
+
+class MappedCatalog:
+    """컴파일된 .kiscat 파일을 mmap 으로 연 카탈로그 (섹션은 처음 사용할 때 연결)
+
+    resident_columns 를 지정하면 해당 컬럼만 처음 접근 시 디코딩해 메모리에 두고,
+    나머지(대용량 텍스트) 컬럼은 문자열 오프셋만 유지하다가 필요할 때 파일에서 읽습니다.
+    None 이면 모든 컬럼을 메모리에 둡니다.
+    """
+
+    def __init__(self, path: str, resident_columns: Optional[Iterable[str]] = None):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a catalog file: {path}")
+        header_len = struct.unpack_from("<I", self._mm, len(MAGIC))[0]
+        header_start = len(MAGIC) + 4
+        self.header = json.loads(self._mm[header_start:header_start + header_len].decode("utf-8"))
+        self._data_start = _align(header_start + header_len)
+        self._view = memoryview(self._mm)
+
+        self.columns: List[str] = self.header["columns"]
+        self.row_count: int = self.header["row_count"]
+        self.version: str = self.header["version"]
+        self.exact_fields: List[str] = self.header["exact_fields"]
+        self.fuzzy_fields: List[str] = self.header.get("fuzzy_fields", [])
+        self.lookup_fields: List[str] = self.header.get("lookup_fields", [])
+        self.field_column: Optional[str] = self.header.get("field_column")
+        self.spec_column: Optional[str] = self.header.get("spec_column")
+        self._specs: Optional[_StringTable] = None
+        self._column_index = {name: i for i, name in enumerate(self.columns)}
+        self.resident_columns = set(self.columns if resident_columns is None else resident_columns)
+        self._resident: Dict[str, List[str]] = {}
+        self._strings: Optional[_StringTable] = None
+        self._cells = None
+        self._postings: Dict[str, MappedPostings] = {}
+
+    def _section(self, name: str) -> memoryview:
+        offset, length = self.header["sections"][name]
+        start = self._data_start + offset
+        return self._view[start:start + length]
+
+    def _string_id(self, row: int, column: str) -> int:
+        if self._cells is None:
+            offset = self._data_start + self.header["sections"]["strings"][0]
+            self._strings = _StringTable(self._section("strings"), offset)
+            self._cells = self._section("cells").cast("I")
+        return self._cells[row * len(self.columns) + self._column_index[column]]
+
+    def value(self, row: int, column: str) -> str:
+        values = self._resident.get(column)
+        if values is not None:
+            return values[row]
+
+        if column in self.resident_columns:
+            self._string_id(0, column)
+            values = self._resident[column] = [
+                self._strings[self._string_id(r, column)] for r in range(self.row_count)
+            ]
+            return values[row]
+
+        # 대용량 컬럼: 오프셋으로 필요한 문자열만 읽음
+        string_id = self._string_id(row, column)
+        if hasattr(os, "pread"):
+            return self._strings.pread(self._file.fileno(), string_id)
+        return self._strings[string_id]
+
+    def postings(self, name: str) -> MappedPostings:
+        table = self._postings.get(name)
+        if table is None:
+            hash_view = self._section(f"hash:{name}") if f"hash:{name}" in self.header["sections"] else None
+            table = self._postings[name] = MappedPostings(self._section(f"postings:{name}"), hash_view)
+        return table
+
+    def lookup(self, field: str, key: str) -> Sequence[int]:
+        """TR ID / REST 경로 등 조회 키 -> 행 번호 (해시 슬롯 조회, 행 스캔 없음)"""
+        if field not in self.lookup_fields:
+            return ()
+        return self.postings(f"lookup:{field}").get(normalize_lookup_key(key), ())
+
+    def field_rows(self, kind: str, key: str) -> Sequence[int]:
+        """응답 필드 코드(kind="code") / 한글 이름(kind="label") -> 행 번호 (해시 슬롯 조회)"""
+        if self.field_column is None:
+            return ()
+        return self.postings(f"field:{kind}").get(normalize_field_key(key), ())
+
+    def arg_specs(self, row: int) -> List[Dict[str, object]]:
+        """행의 파라미터 명세 (빌드 시 파싱해 둔 JSON 을 읽음)"""
+        if self.spec_column is None:
+            return []
+        if self._specs is None:
+            name = f"specs:{self.spec_column}"
+            self._specs = _StringTable(self._section(name), self._data_start + self.header["sections"][name][0])
+        return json.loads(self._specs[row])
+
+    def array(self, name: str) -> Sequence[int]:
+        return self._section(f"array:{name}").cast("I")
+
+    def close(self) -> None:
+        """파일과 mmap 을 닫음
+
+        이 카탈로그에서 꺼낸 postings / 배열 뷰가 남아 있으면 mmap 은 마지막 뷰가 해제될 때 닫힙니다.
+        """
+        self._postings.clear()
+        self._strings = self._specs = self._cells = None
+        self._view.release()
+        self._file.close()
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+
+
+def _open_if_current(path: str, version: str, exact_fields: List[str], fuzzy_fields: List[str],
+                     lookup_fields: List[str],
+                     resident_columns: Optional[Iterable[str]]) -> Optional[MappedCatalog]:
+    try:
+        catalog = MappedCatalog(path, resident_columns)
+    except (OSError, ValueError, KeyError):
+        return None
+    header = catalog.header
+    if (header.get("format") == FORMAT_VERSION and header.get("byteorder") == sys.byteorder
+            and header.get("version") == version and header.get("exact_fields") == exact_fields
+            and header.get("fuzzy_fields") == [name for name in fuzzy_fields if name in catalog.columns]
+            and header.get("lookup_fields") == [name for name in lookup_fields if name in catalog.columns]
+            and header.get("field_column") == (FIELD_COLUMN if FIELD_COLUMN in catalog.columns else None)
+            and header.get("spec_column") == (SPEC_COLUMN if SPEC_COLUMN in catalog.columns else None)):
+        return catalog
+    return None
+
+
+def open_catalog(csv_path: str, exact_fields: Iterable[str] = EXACT_FIELDS,
+                 compiled_path: Optional[str] = None,
+                 resident_columns: Optional[Iterable[str]] = None,
+                 fuzzy_fields: Iterable[str] = FUZZY_FIELDS,
+                 supplement_path: Optional[str] = None,
+                 lookup_fields: Iterable[str] = LOOKUP_FIELDS):
+    """CSV(+ 보조 CSV)와 내용이 같은 컴파일 카탈로그가 있으면 mmap 으로, 없으면 CSV 로드 후 컴파일 파일 생성"""
+    exact_fields = list(exact_fields)
+    fuzzy_fields = list(fuzzy_fields)
+    lookup_fields = list(lookup_fields)
+    version = catalog_version(csv_path, supplement_path)
+    path = compiled_path or compiled_path_for(csv_path)
+    catalog = _open_if_current(path, version, exact_fields, fuzzy_fields, lookup_fields, resident_columns)
+    if catalog is not None:
+        return catalog
+
+    memory_catalog = MemoryCatalog(read_catalog_columns(csv_path, supplement_path), version,
+                                   exact_fields, fuzzy_fields, lookup_fields)
+    try:
+        write_catalog(memory_catalog, path)
+    except OSError:
+        # CSV 옆에 쓸 수 없는 환경(읽기 전용 배포 등)에서만 사용자 전용 임시 디렉터리 사용
+        private_dir = _private_catalog_dir()
+        if private_dir is None:
+            return memory_catalog
+        path = os.path.join(private_dir, f"{version[:16]}{CATALOG_SUFFIX}")
+        catalog = _open_if_current(path, version, exact_fields, fuzzy_fields, lookup_fields, resident_columns)
+        if catalog is not None:
+            return catalog
+        try:
+            write_catalog(memory_catalog, path)
+        except OSError:
+            return memory_catalog
+    # 방금 만든 파일로 다시 열어 대용량 컬럼을 메모리에서 내려놓음
+    catalog = _open_if_current(path, version, exact_fields, fuzzy_fields, lookup_fields, resident_columns)
+    return catalog if catalog is not None else memory_catalog
+
+
+def _private_catalog_dir() -> Optional[str]:
+    """현재 사용자만 접근할 수 있는 임시 카탈로그 디렉터리 (0700, 소유자 확인), 안전하지 않으면 None"""
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        # Windows: 임시 디렉터리가 사용자별 경로
+        path = os.path.join(tempfile.gettempdir(), "kis_catalog")
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            return None
+        return path
+
+    path = os.path.join(tempfile.gettempdir(), f"kis_catalog-{getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != getuid() or info.st_mode & 0o077:
+        return None
+    return path
+
+
+# CLI: build / bench
+
+BENCH_SNIPPETS = {
+    "python (빈 프로세스)": "pass",
+    "pandas.read_csv": "import pandas as pd; pd.read_csv({csv!r})",
+    "CSV 로드 + 인덱스 생성": (
+        "from src.utils.catalog import MemoryCatalog; from src.utils.search_index import SearchIndex; "
+        "c = MemoryCatalog.from_csv({csv!r}); SearchIndex(c, [n for n in c.columns if n not in c.exact_fields], c.exact_fields)"
+    ),
+    "컴파일 카탈로그 (mmap)": (
+        "from src.utils.catalog import MappedCatalog; from src.utils.search_index import SearchIndex; "
+        "c = MappedCatalog({out!r}); SearchIndex(c, [n for n in c.columns if n not in c.exact_fields], c.exact_fields)"
+    ),
+}
+
+
+def run_benchmark(csv_path: str, runs: int = 5) -> None:
+    """로드 방식별 새 프로세스 시작 시간(중앙값) 측정"""
+    out_path = compile_catalog(csv_path, f"{csv_path}.bench{CATALOG_SUFFIX}")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    try:
+        for label, snippet in BENCH_SNIPPETS.items():
+            code = snippet.format(csv=os.path.abspath(csv_path), out=out_path)
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True)
+                timings.append(time.perf_counter() - start)
+                if result.returncode != 0:
+                    break
+            if result.returncode != 0:
+                print(f"{label:<24} 실행 불가 ({result.stderr.decode().strip().splitlines()[-1]})")
+                continue
+            timings.sort()
+            print(f"{label:<24} {timings[len(timings) // 2] * 1000:8.1f} ms (median of {runs})")
+    finally:
+        os.unlink(out_path)
+
+
+def run_filter_benchmark(csv_path: str, runs: int = 2000) -> None:
+    """카테고리 도구별 category + subcategory 필터 / 검색 1회 비용 (μs)
+
+    scan   : 매 호출 모든 행 문자열 비교 (기존 pandas `==` 방식에 해당)
+    set    : postings 집합 교집합
+    bitmap : 사전 계산 비트셋 AND (현재 방식)
+    search : 결과 레코드 생성까지 포함한 도구 1회 호출 (APISearcher.search)
+    """
+    from src.utils.api_searcher import APISearcher
+    from src.utils.search_index import bitmap_rows
+
+    searcher = APISearcher(csv_path, cache_size=0)
+    catalog, index = searcher._state.catalog, searcher._state.index
+    pairs: Dict[str, str] = {}
+    for row in range(catalog.row_count):
+        pairs.setdefault(catalog.value(row, "category"), catalog.value(row, "subcategory"))
+
+    print(f"{'category':<24}{'subcategory':<12}{'rows':>6}{'scan':>10}{'set':>10}{'bitmap':>10}{'search':>10}  (μs/call)")
+    for category, subcategory in pairs.items():
+        def scan():
+            return [row for row in range(catalog.row_count)
+                    if catalog.value(row, "category") == category and catalog.value(row, "subcategory") == subcategory]
+
+        def sets():
+            return sorted(index.equals("category", category) & index.equals("subcategory", subcategory))
+
+        def bitmap():
+            return bitmap_rows(index.equals_mask("category", category) & index.equals_mask("subcategory", subcategory))
+
+        def search():
+            return searcher.search(category=category, subcategory=subcategory)
+
+        timings = [timeit.timeit(fn, number=runs) / runs * 1e6 for fn in (scan, sets, bitmap, search)]
+        print(f"{category:<24}{subcategory:<12}{len(bitmap()):>6}" + "".join(f"{t:>10.1f}" for t in timings))
+
+
+def main(argv=None) -> int:
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    default_csv = os.path.join(root, "data2.csv")
+    default_supplement = os.path.join(root, "data.csv")
+
+    parser = argparse.ArgumentParser(description="API 카탈로그 컴파일 / 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="CSV 를 바이너리 카탈로그로 컴파일")
+    build.add_argument("--csv", default=default_csv)
+    build.add_argument("--supplement", default=default_supplement if os.path.exists(default_supplement) else None,
+                       help="TR ID / REST 경로 / 응답 필드를 가져올 보조 CSV (빈 문자열이면 사용 안 함)")
+    build.add_argument("--out", default=None)
+    bench = subparsers.add_parser("bench", help="시작 시간 벤치마크 (pandas vs 컴파일 카탈로그)")
+    bench.add_argument("--csv", default=default_csv)
+    bench.add_argument("--runs", type=int, default=5)
+    bench_filters = subparsers.add_parser("bench-filters", help="카테고리 도구별 필터 / 검색 1회 비용")
+    bench_filters.add_argument("--csv", default=default_csv)
+    bench_filters.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        out_path = compile_catalog(args.csv, args.out, supplement_path=args.supplement or None)
+        catalog = MappedCatalog(out_path)
+        lookups = ", ".join(f"{name} {len(catalog.postings(f'lookup:{name}'))}" for name in catalog.lookup_fields)
+        print(f"{out_path} ({os.path.getsize(out_path):,} bytes, {catalog.row_count} APIs"
+              + (f", lookup keys: {lookups}" if lookups else "") + ")")
+    elif args.command == "bench-filters":
+        run_filter_benchmark(args.csv, args.runs)
+    else:
+        run_benchmark(args.csv, args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""오타 / 띄어쓰기 허용 검색 (자모 단위 trigram 색인 + 편집 거리)
+
+"현재가조회" / "현재가 조회" / "현재가 조희" 처럼 공백이나 자모 하나가 다른 입력도 찾을 수 있도록
+값을 소문자 + 공백/기호 제거 + 한글 자모 분해 형태로 정규화해 비교합니다.
+
+1. 카탈로그 빌드 시 필드별 자모 trigram -> 행 번호 postings 생성
+2. 검색 시 trigram 겹침 개수(q-gram lemma 하한)로 후보 행을 먼저 줄이고
+3. 후보 행만 부분 문자열 편집 거리를 계산해 임계값 이하인 행 반환
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+FUZZY_GRAM_SIZE = 3
+# 허용 편집 거리 = 정규화된 검색어 길이(자모 수) * 비율, 최대 한 음절 분량(자모 3개)
+FUZZY_MAX_RATIO = 0.2
+FUZZY_MAX_EDITS = 3
+# 이 음절 수 이하의 한글 검색어는 자모 1개 차이(오타 한 번)까지만 허용
+# ("현재가조회" 에서 "조" 를 빼면 "주식현재가 회원사" 와 거리 2 가 되는 것처럼 음절 단위 누락은 다른 뜻이 됨)
+FUZZY_SHORT_SYLLABLES = 6
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            out.append(CHOSEONG[offset // 588])
+            out.append(JUNGSEONG[(offset % 588) // 28])
+            out.append(JONGSEONG[offset % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def fuzzy_key(text: str) -> str:
+    """비교용 정규화: 소문자, 공백/기호 제거, 자모 분해"""
+    return to_jamo("".join(ch for ch in str(text).lower() if ch.isalnum()))
+
+
+def fuzzy_limit(value: str, needle: str) -> int:
+    """허용 편집 거리 (needle = fuzzy_key(value))"""
+    syllables = sum(1 for ch in str(value) if HANGUL_BASE <= ord(ch) <= HANGUL_LAST)
+    if 0 < syllables <= FUZZY_SHORT_SYLLABLES:
+        return 1
+    return min(int(len(needle) * FUZZY_MAX_RATIO), FUZZY_MAX_EDITS)
+
+
+def jamo_grams(key: str, size: int = FUZZY_GRAM_SIZE) -> Set[str]:
+    if len(key) < size:
+        return set()
+    return {key[i:i + size] for i in range(len(key) - size + 1)}
+
+
+def build_fuzzy_postings(values: Iterable[str]) -> Dict[str, List[int]]:
+    """자모 trigram -> 행 번호 postings 생성 (카탈로그 빌드 시 사용)"""
+    postings: Dict[str, Set[int]] = {}
+    for row, value in enumerate(values):
+        for gram in jamo_grams(fuzzy_key(value)):
+            postings.setdefault(gram, set()).add(row)
+    return {gram: sorted(rows) for gram, rows in postings.items()}
+
+
+def substring_distance(pattern: str, text: str, limit: int) -> int:
+    """text 의 임의 부분 문자열과 pattern 사이의 최소 편집 거리 (limit 초과 시 limit + 1)
+
+    Myers 비트 병렬 알고리즘: pattern 의 DP 열 전체를 정수 비트로 표현해 text 문자당 상수 번 연산
+    """
+    if not pattern:
+        return 0
+    peq: Dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << len(pattern)) - 1
+    high = 1 << (len(pattern) - 1)
+
+    pv, mv = mask, 0
+    score = best = len(pattern)
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # 부분 문자열 검색이므로 text 의 시작 위치는 비용 없이 이동 (shift 시 0 유입)
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        if score < best:
+            best = score
+            if best == 0:
+                break
+    return best if best <= limit else limit + 1
+
+
+class FuzzyIndex:
+    """필드 하나에 대한 자모 trigram 색인"""
+
+    def __init__(self, row_count: int, text_of: Callable[[int], str], grams):
+        self.row_count = row_count
+        self._text_of = text_of
+        self._grams = grams
+
+    def match(self, value: str, rows: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """편집 거리 임계값 이내 행 -> 거리"""
+        needle = fuzzy_key(value)
+        needle_grams = jamo_grams(needle)
+        if not needle_grams:
+            return {}
+        limit = fuzzy_limit(value, needle)
+        scope = None if rows is None else set(rows)
+
+        # 편집 1회는 trigram 을 최대 3개 깨뜨리므로 겹침 개수 하한으로 후보 축소
+        overlap: Dict[int, int] = {}
+        for gram in needle_grams:
+            for row in self._grams.get(gram, ()):
+                if scope is None or row in scope:
+                    overlap[row] = overlap.get(row, 0) + 1
+        minimum = max(1, len(needle_grams) - FUZZY_GRAM_SIZE * limit)
+
+        matches = {}
+        for row, count in overlap.items():
+            if count < minimum:
+                continue
+            distance = substring_distance(needle, fuzzy_key(self._text_of(row)), limit)
+            if distance <= limit:
+                matches[row] = distance
+        return matches
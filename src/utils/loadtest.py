@@ -0,0 +1,70 @@
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from fastmcp import Client
+
+# 세션마다 돌아가며 호출하는 검색 도구 호출 (도구 이름, 인자)
+DEFAULT_CALLS: Sequence[Tuple[str, dict]] = (
+    ("search_domestic_stock_api", {"subcategory": "기본시세"}),
+    ("search_domestic_stock_api", {"api_name": "현재가"}),
+    ("search_overseas_stock_api", {"query": "체결 내역", "ranked": True}),
+    ("search_domestic_futureoption_api", {"description": "잔고"}),
+    ("search_auth_api", {"api_name": "토큰"}),
+    ("search_etfetn_api", {"query": "NAV 비교추이"}),
+)
+
+
+async def _session(url: str, requests: int, offset: int, latencies: List[float], errors: List[str]) -> None:
+    """MCP 세션 하나를 열고 requests 번 순차 호출"""
+    try:
+        async with Client(url) as client:
+            for i in range(requests):
+                name, arguments = DEFAULT_CALLS[(offset + i) % len(DEFAULT_CALLS)]
+                started = time.perf_counter()
+                try:
+                    result = await client.call_tool(name, arguments, raise_on_error=False)
+                    if result.is_error:
+                        errors.append(name)
+                except Exception as e:
+                    errors.append(f"{name}: {e}")
+                latencies.append(time.perf_counter() - started)
+    except Exception as e:
+        errors.append(f"session: {e}")
+
+
+async def measure(url: str, sessions: int, requests: int) -> Dict[str, float]:
+    """동시 세션 sessions 개가 각각 requests 번 호출할 때의 처리량 / 지연 시간"""
+    latencies: List[float] = []
+    errors: List[str] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_session(url, requests, i, latencies, errors) for i in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "sessions": sessions,
+        "calls": len(latencies),
+        "errors": len(errors),
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(ordered) * 1000 if ordered else 0.0,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000 if ordered else 0.0,
+    }
+
+
+async def run_load_test(url: str, session_counts: Sequence[int], requests: int) -> int:
+    """loadtest CLI 본체: 동시 세션 수를 늘려 가며 처리량 비교, 종료 코드 반환 (오류가 있으면 1)"""
+    print(f"{url} 에 세션당 {requests}회 호출", file=sys.stderr)
+    print(f"{'sessions':>8} {'calls':>7} {'errors':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    failed = False
+    for sessions in session_counts:
+        row = await measure(url, sessions, requests)
+        failed = failed or row["errors"] > 0
+        print(
+            f"{row['sessions']:>8} {row['calls']:>7} {row['errors']:>6} "
+            f"{row['throughput']:>9.1f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f}"
+        )
+    return 1 if failed else 0
@@ -0,0 +1,243 @@
+"""도구 / 리소스 호출 지표 (외부 의존성 없는 카운터 + 히스토그램, OpenMetrics 텍스트 출력)
+
+관측 1회는 perf_counter 두 번과 bisect 한 번 정도의 비용이라 운영 중에도 켜 둘 수 있습니다.
+캐시 적중률처럼 다른 객체가 이미 세고 있는 값은 출력 시점에 콜백으로 읽습니다.
+"""
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastmcp.server.middleware import Middleware
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# 초 단위 지연 시간 버킷 (캐시 적중 ~10μs 부터 원격 fetch 타임아웃 10s 까지)
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 검색 결과 개수 버킷
+RESULT_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터 (레이블 조합별)"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[Tuple[str, Labels, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}_total", labels, value
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (레이블 조합별 bucket / count / sum)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def samples(self) -> Iterable[Tuple[str, Labels, float]]:
+        with self._lock:
+            items = [(labels, list(counts)) for labels, counts in self._values.items()]
+        for labels, counts in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, counts[-1]
+
+
+class CallbackMetric:
+    """출력 시점에 콜백으로 값을 읽는 지표 (다른 객체의 stats() 재사용)
+
+    callback 은 [(레이블 dict, 값), ...] 을 반환합니다. counter 타입이면 이름 뒤에 _total 이 붙습니다.
+    """
+
+    def __init__(self, name: str, help: str, type: str,
+                 callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]]):
+        self.name = name
+        self.help = help
+        self.type = type
+        self._callback = callback
+
+    def samples(self) -> Iterable[Tuple[str, Labels, float]]:
+        suffix = "_total" if self.type == "counter" else ""
+        for labels, value in self._callback():
+            yield f"{self.name}{suffix}", _labels(labels), float(value)
+
+
+class MetricsRegistry:
+    """지표 모음 + OpenMetrics 텍스트 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter(name, help))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, buckets))
+
+    def callback(self, name: str, help: str, type: str,
+                 callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]]) -> CallbackMetric:
+        return self._register(CallbackMetric(name, help, type, callback))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            try:
+                samples = list(metric.samples())
+            except Exception:
+                # 콜백 대상이 아직 준비되지 않았거나 교체 중이면 해당 지표만 생략
+                continue
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def stats_samples(stats: Dict[str, float], keys: Iterable[str], label: str) -> List[Tuple[Dict[str, str], float]]:
+    """stats() dict 의 여러 키를 label=<키> 레이블 샘플로 변환"""
+    return [({label: key}, stats[key]) for key in keys if key in stats]
+
+
+def resource_name(uri: str) -> str:
+    """리소스 URI -> 레이블 (경로 인자 제외: internal://kis-api/a/b -> kis-api)"""
+    rest = uri.split("://", 1)[-1]
+    return rest.split("/", 1)[0] or uri
+
+
+def _result_count(result) -> Optional[int]:
+    """도구 응답의 total_count (없으면 results 길이)"""
+    content = getattr(result, "structured_content", None)
+    if not isinstance(content, dict):
+        return None
+    if isinstance(content.get("total_count"), int):
+        return content["total_count"]
+    if isinstance(content.get("results"), list):
+        return len(content["results"])
+    return None
+
+
+def _is_error(result) -> bool:
+    content = getattr(result, "structured_content", None)
+    return isinstance(content, dict) and content.get("status") == "error"
+
+
+def _resource_failed(result) -> bool:
+    """리소스 함수는 실패를 예외 대신 "❌ ..." 문자열로 반환"""
+    for item in getattr(result, "contents", None) or (result if isinstance(result, list) else []):
+        content = getattr(item, "text", None) or getattr(item, "content", None)
+        if isinstance(content, str) and content.startswith("❌"):
+            return True
+    return False
+
+
+class ServerMetrics(Middleware):
+    """모든 도구 / 리소스 호출의 지연 시간, 호출 / 오류 횟수, 결과 개수 분포를 기록하는 미들웨어"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.tool_latency = self.registry.histogram(
+            "kis_mcp_tool_duration_seconds", "Tool call latency (count = number of calls)")
+        self.tool_errors = self.registry.counter(
+            "kis_mcp_tool_errors", "Tool calls that raised or returned status=error")
+        self.tool_results = self.registry.histogram(
+            "kis_mcp_tool_results", "Search result count (total_count) per tool call", RESULT_COUNT_BUCKETS)
+        self.resource_latency = self.registry.histogram(
+            "kis_mcp_resource_duration_seconds", "Resource read latency by resource name")
+        self.resource_errors = self.registry.counter(
+            "kis_mcp_resource_errors", "Resource reads that raised or returned an error message")
+
+    async def on_call_tool(self, context, call_next):
+        tool = context.message.name
+        started = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self.tool_latency.observe(time.perf_counter() - started, tool=tool)
+            self.tool_errors.inc(tool=tool)
+            raise
+        self.tool_latency.observe(time.perf_counter() - started, tool=tool)
+        if _is_error(result):
+            self.tool_errors.inc(tool=tool)
+        count = _result_count(result)
+        if count is not None:
+            self.tool_results.observe(count, tool=tool)
+        return result
+
+    async def on_read_resource(self, context, call_next):
+        resource = resource_name(str(context.message.uri))
+        started = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self.resource_latency.observe(time.perf_counter() - started, resource=resource)
+            self.resource_errors.inc(resource=resource)
+            raise
+        self.resource_latency.observe(time.perf_counter() - started, resource=resource)
+        if _resource_failed(result):
+            self.resource_errors.inc(resource=resource)
+        return result
@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import csv
+import gzip
+import json
+import os
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+import httpx
+
+from src.utils.source_cache import DEFAULT_CACHE_DIR, SourceCache
+from src.utils.source_fetcher import GITHUB_RAW_BASE_URL, SourceFetcher
+
+BUNDLE_FILENAME = "source_bundle.jsonl.gz"
+
+
+def catalog_targets(data_path: str) -> List[Tuple[str, str]]:
+    """카탈로그 CSV의 (category, function_name) 목록 (중복 제거, 순서 유지)"""
+    targets = []
+    seen = set()
+    with open(data_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            key = (row["category"], row["function_name"])
+            if key not in seen:
+                seen.add(key)
+                targets.append(key)
+    return targets
+
+
+async def _fetch_with_retry(fetcher: SourceFetcher, url: str, retries: int) -> str:
+    """일시적 오류(네트워크, 429, 5xx)만 지수 백오프로 재시도"""
+    for attempt in range(retries + 1):
+        try:
+            await fetcher.fetch(url)
+            return "ok"
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status == 404:
+                return "missing"
+            if status != 429 and status < 500:
+                return "failed"
+        except httpx.TransportError:
+            pass
+        if attempt < retries:
+            await asyncio.sleep(0.5 * (2 ** attempt))
+    return "failed"
+
+
+async def prefetch_sources(
+    fetcher: SourceFetcher,
+    targets: List[Tuple[str, str]],
+    concurrency: int = 8,
+    retries: int = 3,
+) -> Dict[str, List[str]]:
+    """모든 main/chk 파일을 동시 실행 수 제한 하에 받아 캐시에 저장"""
+    semaphore = asyncio.Semaphore(concurrency)
+    urls = []
+    for category, function_name in targets:
+        urls.append(fetcher.main_url(category, function_name))
+        urls.append(fetcher.check_url(category, function_name))
+
+    async def run(url: str) -> str:
+        async with semaphore:
+            return await _fetch_with_retry(fetcher, url, retries)
+
+    outcomes = await asyncio.gather(*(run(url) for url in urls))
+    summary: Dict[str, List[str]] = {"ok": [], "missing": [], "failed": []}
+    for url, outcome in zip(urls, outcomes):
+        summary[outcome].append(url)
+    return summary
+
+
+def write_bundle(cache: SourceCache, urls: List[str], bundle_path: str) -> int:
+    """캐시된 파일들을 gzip JSONL 번들로 저장 (Docker 이미지 / .dxt 배포용)"""
+    count = 0
+    tmp_path = f"{bundle_path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for url in urls:
+            entry = cache.get(url)
+            if entry is None:
+                continue
+            f.write(json.dumps({
+                "url": entry.url,
+                "etag": entry.etag,
+                "fetched_at": entry.fetched_at,
+                "content": entry.content,
+            }, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_path, bundle_path)
+    return count
+
+
+def read_bundle(bundle_path: str) -> Iterator[dict]:
+    """번들 항목 (url, etag, fetched_at, content)"""
+    with gzip.open(bundle_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def load_bundle(cache: SourceCache, bundle_path: str) -> int:
+    """번들을 캐시에 풀어 넣음 (같은 번들은 한 번만, 더 최신 캐시는 유지)
+
+    캐시 디렉터리에 쓸 수 없으면 디스크에 풀지 않고 번들 전체를 읽기 전용 계층으로 올립니다.
+    """
+    stat = os.stat(bundle_path)
+    marker = os.path.join(cache.cache_dir, f".bundle-{stat.st_size}-{int(stat.st_mtime)}")
+    if os.path.exists(marker):
+        return 0
+
+    count = 0
+    if not cache.is_writable():
+        for item in read_bundle(bundle_path):
+            cache.add_read_only(item["url"], item["content"], item.get("etag"), item["fetched_at"])
+            count += 1
+        return count
+
+    for item in read_bundle(bundle_path):
+        current = cache.peek(item["url"])
+        if current is not None and current.fetched_at >= item["fetched_at"]:
+            continue
+        cache.put(item["url"], item["content"], item.get("etag"), item["fetched_at"])
+        count += 1
+
+    try:
+        open(marker, "w").close()
+    except OSError as e:
+        # 다음 시작 때 다시 풀지만 내용은 이미 캐시에 있으므로 건너뛰는 항목만 늘어남
+        print(f"소스 번들 표시 파일 생성 실패: {e}", file=sys.stderr)
+    return count
+
+
+async def run_prefetch(
+    fetcher: SourceFetcher,
+    data_path: str,
+    bundle_path: str,
+    concurrency: int = 8,
+    retries: int = 3,
+    allow_failures: bool = False,
+) -> int:
+    """prefetch CLI 본체, 종료 코드 반환 (일시적 오류로 실패한 파일이 있으면 1, allow_failures 면 경고만)"""
+    targets = catalog_targets(data_path)
+    print(f"{len(targets)}개 API의 예제 소스를 받는 중... (동시 {concurrency}개)", file=sys.stderr)
+    try:
+        summary = await prefetch_sources(fetcher, targets, concurrency, retries)
+    finally:
+        await fetcher.aclose()
+
+    count = write_bundle(fetcher.cache, summary["ok"], bundle_path)
+    print(
+        f"완료: {len(summary['ok'])}개 저장, {len(summary['missing'])}개 없음(404), "
+        f"{len(summary['failed'])}개 실패 -> {bundle_path} ({count}개 파일)",
+        file=sys.stderr,
+    )
+    for url in summary["failed"]:
+        print(f"  실패: {url}", file=sys.stderr)
+    return 1 if summary["failed"] and not allow_failures else 0
+
+
+def main(argv=None) -> int:
+    """서버를 import 하지 않는 prefetch 진입점 (Docker 빌드용: python -m src.utils.prefetch)"""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description="모든 예제 소스를 미리 받아 캐시와 번들 파일로 저장")
+    parser.add_argument("--csv", default=os.path.join(root, "data2.csv"))
+    parser.add_argument("--bundle", default=os.environ.get("KIS_SOURCE_BUNDLE", os.path.join(root, BUNDLE_FILENAME)),
+                        help="생성할 번들 파일 경로")
+    parser.add_argument("--cache-dir", default=os.environ.get("KIS_SOURCE_CACHE_DIR", DEFAULT_CACHE_DIR))
+    parser.add_argument("--base-url", default=os.environ.get("KIS_SOURCE_BASE_URL", GITHUB_RAW_BASE_URL))
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 다운로드 수")
+    parser.add_argument("--retries", type=int, default=3, help="일시적 오류 재시도 횟수")
+    parser.add_argument("--rate", type=float, default=50.0, help="초당 최대 요청 수")
+    parser.add_argument("--allow-failures", action="store_true",
+                        help="받지 못한 파일이 있어도 종료 코드 0 (받은 파일만 번들에 저장)")
+    args = parser.parse_args(argv)
+
+    fetcher = SourceFetcher(
+        args.base_url,
+        cache=SourceCache(args.cache_dir),
+        rate=args.rate,
+        burst=args.concurrency,
+        max_connections=args.concurrency,
+    )
+    return asyncio.run(run_prefetch(fetcher, args.csv, args.bundle, args.concurrency, args.retries,
+                                    args.allow_failures))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
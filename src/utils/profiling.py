@@ -0,0 +1,164 @@
+"""호출 단위 프로파일링 (옵트인, 꺼져 있으면 미들웨어 / 훅 자체를 등록하지 않음)
+
+선택된 도구 / 리소스 / 검색 호출을 샘플링해 cProfile 로 측정하고 호출마다 파일 3개를 남깁니다.
+
+    {dir}/{시각}-{순번}-{이름}.prof     pstats 형식 (python -m pstats, snakeviz 등)
+    {dir}/{시각}-{순번}-{이름}.folded   flame graph 용 collapsed stack (flamegraph.pl, speedscope)
+    {dir}/{시각}-{순번}-{이름}.json     이름, 인자, 소요 시간
+
+cProfile 은 스레드 단위이므로 검색 본체(APISearcher.search)는 워커 스레드 안에서 "search" 이름으로 따로 측정합니다.
+도구 / 리소스 측정 구간에는 같은 이벤트 루프에서 동시에 실행된 다른 요청도 섞일 수 있습니다.
+"""
+import cProfile
+import fnmatch
+import itertools
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastmcp.server.middleware import Middleware
+
+from src.utils.metrics import resource_name
+
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kis_api_search", "profiles")
+
+FuncKey = Tuple[str, int, str]
+
+
+def _frame_name(func: FuncKey) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name  # 내장 함수: "<built-in method ...>"
+    return f"{os.path.basename(filename)}:{line}:{name}"
+
+
+def folded_stacks(stats: pstats.Stats, unit: float = 1e6) -> List[str]:
+    """cProfile 호출 그래프 -> collapsed stack 줄 목록 ("a;b;c 값", 값은 μs)
+
+    cProfile 은 호출자-피호출자 쌍만 기록하므로, 피호출자의 시간을 호출자별 누적 시간 비율로 나눠
+    스택을 복원합니다 (재귀 호출은 한 번만 펼침).
+    """
+    entries = stats.stats
+    callees: Dict[FuncKey, List[Tuple[FuncKey, float]]] = {}
+    for func, (_, _, _, total, callers) in entries.items():
+        for caller, (_, _, _, edge_total) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_total))
+
+    lines: Dict[str, float] = {}
+
+    def walk(func: FuncKey, share: float, path: List[str], seen: frozenset) -> None:
+        _, _, self_time, total, _ = entries[func]
+        # 1μs 미만 가지는 펼치지 않음 (호출 그래프가 넓을 때 경로 수 폭증 방지)
+        if total * share < 1e-6:
+            return
+        path = path + [_frame_name(func)]
+        if self_time * share > 0:
+            key = ";".join(path)
+            lines[key] = lines.get(key, 0.0) + self_time * share
+        for callee, edge_total in callees.get(func, ()):
+            callee_total = entries[callee][3]
+            if callee in seen or callee_total <= 0:
+                continue
+            walk(callee, share * edge_total / callee_total, path, seen | {callee})
+
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    for root in roots:
+        walk(root, 1.0, [], frozenset({root}))
+    return [f"{stack} {round(value * unit)}" for stack, value in lines.items() if round(value * unit) > 0]
+
+
+class CallProfiler(Middleware):
+    """샘플링된 호출을 cProfile 로 측정해 dump 디렉터리에 저장
+
+    targets: 이름 패턴 목록 (fnmatch, 예: "search", "fetch_api_code", "kis-api*"), 비어 있으면 전부
+    rate: 대상 호출 중 측정할 비율 (0~1)
+    min_duration: 이 시간(초)보다 빨리 끝난 호출은 저장하지 않음 (느린 호출만 남길 때)
+    """
+
+    def __init__(self, directory: str, rate: float = 1.0, targets: Iterable[str] = (),
+                 min_duration: float = 0.0):
+        self.directory = directory
+        self.rate = rate
+        self.targets = [pattern for pattern in targets if pattern]
+        self.min_duration = min_duration
+        self._sequence = itertools.count(1)
+        # cProfile 은 스레드당 하나만 활성화할 수 있으므로 이미 측정 중인 스레드의 호출은 건너뜀
+        self._active = threading.local()
+        os.makedirs(directory, exist_ok=True)
+
+    def wants(self, name: str) -> bool:
+        if self.targets and not any(fnmatch.fnmatchcase(name, pattern) for pattern in self.targets):
+            return False
+        return self.rate >= 1.0 or random.random() < self.rate
+
+    def _start(self) -> Optional[cProfile.Profile]:
+        if getattr(self._active, "profiling", False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 동작 중 (3.12+ sys.monitoring)
+            return None
+        self._active.profiling = True
+        return profile
+
+    def _finish(self, profile: cProfile.Profile, name: str, arguments: Dict[str, Any], elapsed: float,
+                error: Optional[str]) -> None:
+        profile.disable()
+        self._active.profiling = False
+        if elapsed < self.min_duration:
+            return
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        base = os.path.join(
+            self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{next(self._sequence):05d}-{safe_name}"
+        )
+        stats = pstats.Stats(profile)
+        stats.dump_stats(f"{base}.prof")
+        with open(f"{base}.folded", "w", encoding="utf-8") as f:
+            f.write("\n".join(folded_stacks(stats)) + "\n")
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump({"name": name, "arguments": arguments, "elapsed_ms": round(elapsed * 1000, 3),
+                       "error": error}, f, ensure_ascii=False, default=str, indent=2)
+
+    def call(self, name: str, func: Callable, *args, **kwargs):
+        """동기 호출 측정 (검색 워커 스레드에서 사용)"""
+        profile = self._start() if self.wants(name) else None
+        if profile is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = repr(e)
+            raise
+        finally:
+            self._finish(profile, name, kwargs, time.perf_counter() - started, error)
+
+    async def _around(self, name: str, arguments: Dict[str, Any], context, call_next):
+        profile = self._start() if self.wants(name) else None
+        if profile is None:
+            return await call_next(context)
+        started = time.perf_counter()
+        error = None
+        try:
+            return await call_next(context)
+        except Exception as e:
+            error = repr(e)
+            raise
+        finally:
+            self._finish(profile, name, arguments, time.perf_counter() - started, error)
+
+    async def on_call_tool(self, context, call_next):
+        message = context.message
+        return await self._around(message.name, message.arguments or {}, context, call_next)
+
+    async def on_read_resource(self, context, call_next):
+        uri = str(context.message.uri)
+        return await self._around(resource_name(uri), {"uri": uri}, context, call_next)
@@ -0,0 +1,144 @@
+"""검색 질의 로그 (인덱스 / 캐시 크기 조정용)
+
+도구 호출 경로에서는 고정 크기 링 버퍼에 dict 를 넣기만 하고(가득 차면 가장 오래된 항목을 버림),
+백그라운드 스레드가 주기적으로 꺼내 gzip JSONL 파일에 이어 씁니다. 파일이 max_bytes 를 넘으면
+시각(나노초)을 붙인 이름으로 바꾸고 최근 backups 개만 남깁니다.
+
+    {dir}/queries.jsonl.gz                      현재 파일 (flush 마다 gzip member 추가, zcat 으로 읽음)
+    {dir}/queries.{time_ns 20자리}.jsonl.gz      교체된 파일
+"""
+import fnmatch
+import glob
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Optional
+
+from fastmcp.server.middleware import Middleware
+
+DEFAULT_QUERY_LOG_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kis_api_search", "query_log")
+CURRENT_FILENAME = "queries.jsonl.gz"
+
+
+class QueryLog(Middleware):
+    """검색 도구 호출을 비동기로 기록하는 미들웨어 (기록 때문에 도구 응답이 늦어지지 않음)
+
+    tools: 기록할 도구 이름 패턴 (fnmatch)
+    capacity: 링 버퍼 크기, 쓰기가 밀려 가득 차면 오래된 항목부터 버리고 dropped 로 셈
+    """
+
+    def __init__(self, directory: str = DEFAULT_QUERY_LOG_DIR, capacity: int = 4096,
+                 flush_interval: float = 1.0, max_bytes: int = 16 * 1024 * 1024, backups: int = 10,
+                 tools: Iterable[str] = ("search_*",)):
+        self.directory = directory
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.tools = tuple(tools)
+        self._buffer: deque = deque(maxlen=capacity)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.counters: Dict[str, int] = {"recorded": 0, "written": 0, "dropped": 0, "write_errors": 0, "rotations": 0}
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, CURRENT_FILENAME)
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """버퍼에 추가만 함 (블로킹 없음)"""
+        if len(self._buffer) >= self.capacity:
+            self.counters["dropped"] += 1
+        self._buffer.append(entry)
+        self.counters["recorded"] += 1
+        if self._writer is None:
+            self._start()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._writer is None and not self._stopping.is_set():
+                self._writer = threading.Thread(target=self._run, name="query-log", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 항목을 파일에 씀 (백그라운드 스레드 / 종료 시 호출)"""
+        lines = []
+        while True:
+            try:
+                lines.append(json.dumps(self._buffer.popleft(), ensure_ascii=False, default=str))
+            except IndexError:
+                break
+        if not lines:
+            return 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self.counters["written"] += len(lines)
+            if os.path.getsize(self.path) >= self.max_bytes:
+                self._rotate()
+        except OSError as e:
+            self.counters["write_errors"] += 1
+            print(f"질의 로그 기록 실패: {e}", file=sys.stderr)
+        return len(lines)
+
+    def _rotate(self) -> None:
+        # 이름이 겹치면 기존 파일을 덮어쓰지 않고 실패하도록 대상 이름을 배타적으로 먼저 만듦
+        rotated = os.path.join(self.directory, f"queries.{time.time_ns():020d}.jsonl.gz")
+        open(rotated, "x").close()
+        os.replace(self.path, rotated)
+        self.counters["rotations"] += 1
+        old = sorted(glob.glob(os.path.join(self.directory, "queries.*.jsonl.gz")))
+        for path in old[:max(0, len(old) - self.backups)]:
+            os.remove(path)
+
+    def close(self) -> None:
+        """남은 항목을 쓰고 백그라운드 스레드 종료"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._writer is not None:
+            self._writer.join()
+        else:
+            self.flush()
+
+    def stats(self) -> dict:
+        return {**self.counters, "buffered": len(self._buffer), "capacity": self.capacity, "path": self.path}
+
+    async def on_call_tool(self, context, call_next):
+        tool = context.message.name
+        if not any(fnmatch.fnmatchcase(tool, pattern) for pattern in self.tools):
+            return await call_next(context)
+
+        started = time.perf_counter()
+        result = None
+        try:
+            result = await call_next(context)
+            return result
+        finally:
+            content = getattr(result, "structured_content", None)
+            if not isinstance(content, dict):
+                content = {}
+            arguments = dict(context.message.arguments or {})
+            self.record({
+                "ts": round(time.time(), 3),
+                "tool": tool,
+                "query": arguments.pop("query", None),
+                "params": arguments,
+                "status": content.get("status", "exception" if result is None else None),
+                "result_count": content.get("total_count"),
+                "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+                "catalog_version": content.get("catalog_version"),
+            })
@@ -0,0 +1,167 @@
+import asyncio
+import contextlib
+import functools
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.api_searcher import APISearcher
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+# process 모드 워커 프로세스마다 하나씩 만드는 searcher
+_worker_searcher: Optional[APISearcher] = None
+
+
+def _init_worker(filepath: str, searcher_options: Dict[str, Any]) -> None:
+    global _worker_searcher
+    _worker_searcher = APISearcher(filepath, **searcher_options)
+
+
+def _worker_search(kwargs: Dict[str, Any], catalog_version: Optional[str] = None) -> dict:
+    """워커에서 검색 (부모의 카탈로그 버전과 다르면 부모가 컴파일해 둔 카탈로그를 다시 엶)"""
+    if catalog_version is not None and catalog_version != _worker_searcher.catalog_version:
+        _worker_searcher.reload_if_changed()
+    return _worker_searcher.search(**kwargs)
+
+
+@contextlib.contextmanager
+def _main_module_hidden():
+    """spawn 워커가 서버 스크립트(__main__)를 다시 실행하지 않도록 워커를 띄우는 동안 경로를 숨김
+
+    숨기지 않으면 워커마다 server.py 전체(FastMCP, searcher, fetcher)를 다시 로드합니다.
+    워커에 필요한 함수는 모두 이 모듈에 있으므로 __main__ 없이도 동작합니다.
+    """
+    main = sys.modules.get("__main__")
+    path = getattr(main, "__file__", None)
+    spec = getattr(main, "__spec__", None)
+    if path is None and spec is None:
+        yield
+        return
+    if path is not None:
+        del main.__file__
+    main.__spec__ = None
+    try:
+        yield
+    finally:
+        if path is not None:
+            main.__file__ = path
+        main.__spec__ = spec
+
+
+def gil_enabled() -> bool:
+    """free-threaded 빌드(3.13t)에서 GIL 이 꺼져 있으면 False"""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return check() if check is not None else True
+
+
+class SearchExecutor:
+    """검색을 이벤트 루프 밖의 워커 풀에서 실행 (대기열 크기 제한)
+
+    mode:
+        thread  : 같은 searcher 를 스레드 풀에서 실행 (free-threaded 빌드에서는 실제 병렬 실행)
+        process : 워커 프로세스마다 searcher 를 따로 로드 (GIL 빌드에서 병렬 실행이 필요할 때)
+                  파일 감시 / 재컴파일은 부모 searcher 만 하고, 워커는 요청과 함께 받은 부모의
+                  카탈로그 버전이 자기 것과 다를 때 카탈로그를 다시 엽니다.
+        inline  : 풀 없이 이벤트 루프에서 바로 실행 (기존 동작)
+
+    실행 중 + 대기 중인 요청이 workers + queue_size 를 넘으면 queue_timeout 초까지 기다린 뒤
+    자리가 나지 않으면 error 응답을 반환합니다.
+    latency 히스토그램이 주어지면 풀에 넘긴 뒤 결과를 받을 때까지의 시간을 기록합니다.
+    profiler(CallProfiler)가 주어지면 thread / inline 모드의 검색 본체를 "search" 이름으로 측정합니다.
+    """
+
+    def __init__(self, searcher: APISearcher, mode: str = "thread", workers: Optional[int] = None,
+                 queue_size: int = 64, queue_timeout: float = 10.0,
+                 searcher_options: Optional[Dict[str, Any]] = None, latency=None, profiler=None):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {mode} (expected one of {', '.join(EXECUTOR_MODES)})")
+        self.searcher = searcher
+        self.mode = mode
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency = latency
+        self.profiler = profiler
+        self._slots = asyncio.Semaphore(self.workers + queue_size)
+        self.counters: Dict[str, int] = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._in_flight = 0
+
+        if mode == "thread":
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="search")
+        elif mode == "process":
+            # 이벤트 루프 / 감시 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(searcher.filepath, searcher_options or {}),
+            )
+        else:
+            self._executor = None
+
+    async def search(self, **kwargs) -> dict:
+        if self._executor is None:
+            started = time.perf_counter()
+            try:
+                return self._search_call(**kwargs)()
+            finally:
+                self._observe(started)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.counters["rejected"] += 1
+            return {
+                "status": "error",
+                "message": f"Search queue is full ({self.workers + self.queue_size} pending), retry later",
+                "total_count": 0,
+                "results": []
+            }
+
+        self.counters["submitted"] += 1
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            if self.mode == "process":
+                # 워커는 필요할 때 submit 안에서 시작되므로 submit 동안 __main__ 을 숨김
+                with _main_module_hidden():
+                    future = self._executor.submit(_worker_search, kwargs, self.searcher.catalog_version)
+                result = await asyncio.wrap_future(future)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(self._executor, self._search_call(**kwargs))
+            self.counters["completed"] += 1
+            return result
+        except Exception:
+            self.counters["failed"] += 1
+            raise
+        finally:
+            self._observe(started)
+            self._in_flight -= 1
+            self._slots.release()
+
+    def _search_call(self, **kwargs) -> Callable[[], dict]:
+        if self.profiler is not None:
+            return functools.partial(self.profiler.call, "search", self.searcher.search, **kwargs)
+        return functools.partial(self.searcher.search, **kwargs)
+
+    def _observe(self, started: float) -> None:
+        if self.latency is not None:
+            self.latency.observe(time.perf_counter() - started, mode=self.mode)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            **self.counters,
+            "mode": self.mode,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self._in_flight,
+            "gil_enabled": gil_enabled(),
+        }
@@ -0,0 +1,254 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from src.utils.fuzzy import FuzzyIndex
+
+# str.contains(regex=True)에서 특수 의미를 갖는 문자
+REGEX_META_CHARS = set('.^$*+?{}[]\\|()')
+NGRAM_SIZE = 2
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+HANGUL_PATTERN = re.compile(r'[가-힣]+')
+
+# postings 테이블: 키 -> 정렬된 행 번호 시퀀스 (dict 또는 mmap 기반 테이블)
+Postings = Mapping[str, Sequence[int]]
+
+EMPTY: Sequence[int] = ()
+
+
+def tokenize(text: str) -> List[str]:
+    """영문/숫자 단어 + 한글 n-gram 토큰 분리"""
+    text = str(text).lower()
+    tokens = WORD_PATTERN.findall(text)
+    for chunk in HANGUL_PATTERN.findall(text):
+        if len(chunk) < NGRAM_SIZE:
+            tokens.append(chunk)
+        else:
+            tokens.extend(chunk[i:i + NGRAM_SIZE] for i in range(len(chunk) - NGRAM_SIZE + 1))
+    return tokens
+
+
+def char_ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    """문자 n-gram 집합 (공백/기호 포함)"""
+    if len(text) < size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _finish(postings: Dict[str, Set[int]]) -> Dict[str, List[int]]:
+    return {key: sorted(rows) for key, rows in postings.items()}
+
+
+def build_text_postings(values: Iterable[str]) -> Tuple[Dict[str, Dict[str, List[int]]], List[int]]:
+    """텍스트 컬럼의 문자 / n-gram / 단어 postings + 단어 빈도(tf) + 문서 길이 생성 (카탈로그 빌드 시 사용)
+
+    tf 테이블은 words 테이블과 같은 키를 가지며, 값은 words 의 행 순서에 맞춘 출현 횟수입니다.
+    """
+    chars: Dict[str, Set[int]] = {}
+    grams: Dict[str, Set[int]] = {}
+    counts: Dict[str, Dict[int, int]] = {}
+    doc_lengths: List[int] = []
+
+    for row, value in enumerate(values):
+        text = value.lower()
+        for ch in set(text):
+            chars.setdefault(ch, set()).add(row)
+        for gram in char_ngrams(text):
+            grams.setdefault(gram, set()).add(row)
+        tokens = tokenize(text)
+        doc_lengths.append(len(tokens))
+        for word, tf in Counter(tokens).items():
+            counts.setdefault(word, {})[row] = tf
+
+    words = {word: sorted(rows) for word, rows in counts.items()}
+    tfs = {word: [counts[word][row] for row in rows] for word, rows in words.items()}
+    return {"chars": _finish(chars), "grams": _finish(grams), "words": words, "tf": tfs}, doc_lengths
+
+
+def to_bitmap(rows: Iterable[int], row_count: int) -> int:
+    """행 번호 집합 -> 비트셋 (int, row 번째 비트가 1)"""
+    bits = bytearray((row_count + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def bitmap_rows(mask: int) -> List[int]:
+    """비트셋 -> 정렬된 행 번호 리스트"""
+    rows = []
+    while mask:
+        low = mask & -mask
+        rows.append(low.bit_length() - 1)
+        mask ^= low
+    return rows
+
+
+def build_exact_postings(values: Iterable[str]) -> Dict[str, List[int]]:
+    """정확 매칭 컬럼의 값 -> 행 번호 postings 생성"""
+    groups: Dict[str, Set[int]] = {}
+    for row, value in enumerate(values):
+        groups.setdefault(value, set()).add(row)
+    return _finish(groups)
+
+
+class TextColumnIndex:
+    """텍스트 컬럼 하나에 대한 역색인 (문자 n-gram + 단어 postings)"""
+
+    def __init__(self, row_count: int, text_of: Callable[[int], str],
+                 chars: Postings, grams: Postings, words: Postings):
+        self.row_count = row_count
+        self._text_of = text_of
+        self._chars = chars
+        self._grams = grams
+        self._words = words
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def text(self, row: int) -> str:
+        """소문자로 정규화된 원문"""
+        return self._text_of(row).lower()
+
+    def word_rows(self, word: str) -> Sequence[int]:
+        """토큰 단위 postings 조회"""
+        return self._words.get(word.lower(), EMPTY)
+
+    def _candidates(self, needle: str) -> Set[int]:
+        """n-gram postings 교집합으로 후보 행 축소"""
+        if len(needle) < NGRAM_SIZE:
+            return set(self._chars.get(needle, EMPTY))
+
+        postings = sorted((self._grams.get(g, EMPTY) for g in char_ngrams(needle)), key=len)
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            if not rows:
+                break
+            rows.intersection_update(posting)
+        return rows
+
+    def contains(self, value: str, rows: Optional[Iterable[int]] = None) -> Set[int]:
+        """str.contains(value, case=False) 와 동일한 결과의 행 번호 집합"""
+        value = str(value)
+        scope = set(range(self.row_count)) if rows is None else set(rows)
+
+        # 정규식 패턴은 색인으로 판단할 수 없으므로 후보 범위 내에서 직접 매칭
+        # (잘못된 정규식은 일반 문자열로 취급)
+        if any(ch in REGEX_META_CHARS for ch in value):
+            try:
+                pattern = re.compile(value, re.IGNORECASE)
+            except re.error:
+                pattern = None
+            if pattern is not None:
+                return {row for row in scope if pattern.search(self.text(row))}
+
+        needle = value.lower()
+        if not needle:
+            return scope
+
+        candidates = self._candidates(needle) & scope
+        return {row for row in candidates if needle in self.text(row)}
+
+
+class SearchIndex:
+    """카탈로그의 사전 계산 postings 위에서 동작하는 컬럼별 검색 인덱스"""
+
+    def __init__(self, catalog, text_fields: Iterable[str], exact_fields: Iterable[str] = (),
+                 fuzzy_fields: Iterable[str] = ()):
+        self.row_count = catalog.row_count
+        self.text: Dict[str, TextColumnIndex] = {}
+        for name in text_fields:
+            if name in catalog.columns:
+                self.text[name] = TextColumnIndex(
+                    catalog.row_count,
+                    lambda row, name=name: catalog.value(row, name),
+                    catalog.postings(f"text:{name}:chars"),
+                    catalog.postings(f"text:{name}:grams"),
+                    catalog.postings(f"text:{name}:words"),
+                )
+        # 정확 매칭 필드: 값 -> 행 번호
+        self.exact: Dict[str, Postings] = {
+            name: catalog.postings(f"exact:{name}") for name in exact_fields if name in catalog.columns
+        }
+        # 정확 매칭 필드 비트맵: 값 -> 비트셋 (필터끼리 비트 AND 로 결합)
+        self.all_rows = (1 << self.row_count) - 1
+        self.bitmaps: Dict[str, Dict[str, int]] = {
+            name: {value: to_bitmap(rows, self.row_count) for value, rows in postings.items()}
+            for name, postings in self.exact.items()
+        }
+        # 오타 허용 필드: 자모 trigram 색인
+        self.fuzzy: Dict[str, FuzzyIndex] = {
+            name: FuzzyIndex(
+                catalog.row_count,
+                lambda row, name=name: catalog.value(row, name),
+                catalog.postings(f"fuzzy:{name}"),
+            )
+            for name in fuzzy_fields if name in catalog.fuzzy_fields
+        }
+
+    def equals(self, field: str, value: Any) -> Set[int]:
+        return set(self.exact[field].get(value, EMPTY))
+
+    def equals_mask(self, field: str, value: Any) -> int:
+        return self.bitmaps[field].get(value, 0)
+
+    def contains(self, field: str, value: str, rows: Optional[Iterable[int]] = None) -> Set[int]:
+        return self.text[field].contains(value, rows)
+
+    def fuzzy_match(self, field: str, value: str, rows: Optional[Iterable[int]] = None) -> Set[int]:
+        """편집 거리 임계값 이내 행 중 거리가 가장 가까운 행 번호 집합 (색인이 없는 필드는 빈 집합)"""
+        index = self.fuzzy.get(field)
+        matches = index.match(value, rows) if index is not None else {}
+        if not matches:
+            return set()
+        best = min(matches.values())
+        return {row for row, distance in matches.items() if distance == best}
+
+
+class BM25Index:
+    """필드 가중치 BM25 랭킹 (카탈로그에 미리 계산된 tf / 문서 길이 사용)"""
+
+    def __init__(self, catalog, field_weights: Dict[str, float]):
+        self.row_count = catalog.row_count
+        self._fields = []
+        for name, weight in field_weights.items():
+            if name not in catalog.columns:
+                continue
+            doc_lengths = catalog.array(f"doclen:{name}")
+            average = (sum(doc_lengths) / len(doc_lengths)) if len(doc_lengths) else 0.0
+            self._fields.append((
+                weight,
+                catalog.postings(f"text:{name}:words"),
+                catalog.postings(f"text:{name}:tf"),
+                doc_lengths,
+                average or 1.0,
+            ))
+
+    def scores(self, query: str, rows: Optional[Set[int]] = None) -> Dict[int, float]:
+        """질의 토큰이 하나라도 나오는 행의 점수 (rows 가 주어지면 그 안에서만)"""
+        terms = set(tokenize(query))
+        scores: Dict[int, float] = {}
+        for weight, words, tfs, doc_lengths, average in self._fields:
+            for term in terms:
+                posting = words.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (self.row_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for row, tf in zip(posting, tfs[term]):
+                    if rows is not None and row not in rows:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[row] / average)
+                    scores[row] = scores.get(row, 0.0) + weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+
+
+def top_k(scores: Mapping[int, float], k: int) -> List[Tuple[int, float]]:
+    """점수 상위 k 개 (동점이면 카탈로그 순서), 힙 선택으로 전체 정렬 없이 계산"""
+    return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
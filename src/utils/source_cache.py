@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kis_api_search", "sources")
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 소스 파일 한 건"""
+    url: str
+    sha256: str
+    etag: Optional[str]
+    fetched_at: float
+    content: str
+
+    def is_fresh(self, ttl: float) -> bool:
+        return (time.time() - self.fetched_at) < ttl
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename (동시 실행 프로세스가 반쯤 쓴 파일을 읽지 않도록)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class SourceCache:
+    """예제 소스 캐시 (메모리 LRU + 디스크 content-addressed 저장소)
+
+    디스크 구조:
+        {cache_dir}/objects/{sha256[:2]}/{sha256}   파일 내용 (내용 해시 기준, 중복 저장 없음)
+        {cache_dir}/refs/{sha256(url)}.json         url -> 내용 해시, ETag, 받은 시각
+        {cache_dir}/derived/{종류}/{키}              파일 내용에서 만든 부가 데이터 (요약 등, 키에 내용 해시 포함)
+
+    디스크에 쓸 수 없는 환경에서는 소스 번들을 읽기 전용 계층(add_read_only)으로 올려 디스크 다음 순서로 조회합니다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: float = 86400, memory_size: int = 128):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # 디스크 조회 / 저장은 스레드에서도 호출되므로 메모리 LRU 변경은 잠금 아래에서
+        self._lock = threading.Lock()
+        self._read_only: Dict[str, CacheEntry] = {}
+        self.counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "bundle_hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stale_served": 0,
+            "stores": 0,
+            "write_errors": 0,
+            "derived_hits": 0,
+            "derived_misses": 0,
+        }
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, "refs", f"{_sha256(url)}.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "objects", digest[:2], digest)
+
+    def _remember(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._memory[entry.url] = entry
+            self._memory.move_to_end(entry.url)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _load_from_disk(self, url: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._ref_path(url), "r", encoding="utf-8") as f:
+                ref = json.load(f)
+            with open(self._object_path(ref["sha256"]), "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return CacheEntry(url, ref["sha256"], ref.get("etag"), ref["fetched_at"], content)
+
+    def peek(self, url: str) -> Optional[CacheEntry]:
+        """통계/LRU 갱신 없이 디스크 항목만 확인"""
+        return self._load_from_disk(url)
+
+    def get_memory(self, url: str) -> Optional[CacheEntry]:
+        """메모리 LRU 만 조회 (디스크 I/O 없음, 이벤트 루프에서 바로 호출 가능)"""
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+                self.counters["memory_hits"] += 1
+            return entry
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """메모리 -> 디스크 순으로 조회 (만료 여부와 관계없이 반환)"""
+        entry = self.get_memory(url)
+        if entry is not None:
+            return entry
+
+        entry = self._load_from_disk(url)
+        if entry is not None:
+            self.counters["disk_hits"] += 1
+        else:
+            entry = self._read_only.get(url)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            self.counters["bundle_hits"] += 1
+        self._remember(entry)
+        return entry
+
+    def is_writable(self) -> bool:
+        """캐시 디렉터리에 파일을 만들 수 있는지 확인"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        except OSError:
+            return False
+        os.close(fd)
+        os.unlink(path)
+        return True
+
+    def add_read_only(self, url: str, content: str, etag: Optional[str], fetched_at: float) -> CacheEntry:
+        """읽기 전용 계층에 항목 추가 (디스크에 없을 때 조회, 메모리 LRU 크기와 무관하게 모두 유지)"""
+        entry = CacheEntry(url, _sha256(content), etag, fetched_at, content)
+        self._read_only[url] = entry
+        return entry
+
+    def put(self, url: str, content: str, etag: Optional[str] = None,
+            fetched_at: Optional[float] = None) -> CacheEntry:
+        """내용 저장 (같은 내용이면 객체 파일은 재사용, 디스크에 쓸 수 없으면 메모리에만 보관)"""
+        digest = _sha256(content)
+        entry = CacheEntry(url, digest, etag, fetched_at or time.time(), content)
+
+        object_path = self._object_path(digest)
+        try:
+            if not os.path.exists(object_path):
+                _atomic_write(object_path, content.encode("utf-8"))
+            self._write_ref(entry)
+        except OSError:
+            self.counters["write_errors"] += 1
+
+        self.counters["stores"] += 1
+        self._remember(entry)
+        return entry
+
+    def touch(self, entry: CacheEntry) -> CacheEntry:
+        """304 Not Modified 응답 시 받은 시각만 갱신"""
+        entry.fetched_at = time.time()
+        try:
+            self._write_ref(entry)
+        except OSError:
+            self.counters["write_errors"] += 1
+        self.counters["revalidated"] += 1
+        self._remember(entry)
+        return entry
+
+    def _derived_path(self, kind: str, key: str) -> str:
+        return os.path.join(self.cache_dir, "derived", kind, key)
+
+    def get_derived(self, kind: str, key: str) -> Optional[str]:
+        """부가 데이터 조회 (디스크)"""
+        try:
+            with open(self._derived_path(kind, key), "r", encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            self.counters["derived_misses"] += 1
+            return None
+        self.counters["derived_hits"] += 1
+        return content
+
+    def put_derived(self, kind: str, key: str, content: str) -> None:
+        try:
+            _atomic_write(self._derived_path(kind, key), content.encode("utf-8"))
+        except OSError:
+            # 읽기 전용 캐시 디렉터리면 메모리 캐시만 사용
+            pass
+
+    def _write_ref(self, entry: CacheEntry) -> None:
+        ref = {k: v for k, v in asdict(entry).items() if k != "content"}
+        _atomic_write(self._ref_path(entry.url), json.dumps(ref, ensure_ascii=False).encode("utf-8"))
+
+    def stats(self) -> dict:
+        hits = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["bundle_hits"]
+        lookups = hits + self.counters["misses"]
+        return {
+            **self.counters,
+            "memory_entries": len(self._memory),
+            "memory_size": self.memory_size,
+            "read_only_entries": len(self._read_only),
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "ttl": self.ttl,
+            "cache_dir": self.cache_dir,
+        }
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from src.utils.source_cache import SourceCache
+
+GITHUB_RAW_BASE_URL = "https://raw.githubusercontent.com/koreainvestment/open-trading-api/main/examples_llm"
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 rate limiter (이벤트 루프를 막지 않음)"""
+
+    def __init__(self, rate: float = 10.0, capacity: int = 5):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 1개를 소비, 부족하면 채워질 때까지 비동기 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SourceUnavailable(Exception):
+    """오프라인 모드에서 캐시에도 없는 파일 요청"""
+
+
+class SourceFetcher:
+    """GitHub 예제 소스 비동기 다운로드 (공유 커넥션 풀 + keep-alive + HTTP/2)
+
+    cache 가 주어지면 TTL 이내 캐시는 그대로 사용하고, 만료된 항목은 ETag 로 재검증합니다.
+    네트워크 오류 시 또는 offline=True 일 때는 만료된 캐시라도 반환합니다.
+    latency(observe(seconds, outcome=...) 를 가진 히스토그램)가 주어지면 원격 요청마다 소요 시간을 기록합니다.
+
+    같은 URL 원격 요청이 진행 중이면 새로 보내지 않고 진행 중인 요청의 결과(또는 예외)를 함께 받습니다
+    (single-flight, 합쳐진 호출 수는 counters["coalesced"]).
+    캐시 디스크 조회 / 저장은 이벤트 루프를 막지 않도록 스레드에서 실행합니다 (메모리 LRU 적중은 바로 반환).
+    """
+
+    def __init__(
+        self,
+        base_url: str = GITHUB_RAW_BASE_URL,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        rate: float = 10.0,
+        burst: int = 5,
+        cache: Optional[SourceCache] = None,
+        offline: bool = False,
+        latency=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.limiter = TokenBucket(rate, burst)
+        self.cache = cache
+        self.offline = offline
+        self.latency = latency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.counters: Dict[str, int] = {"upstream": 0, "coalesced": 0}
+
+    def main_url(self, category: str, function_name: str) -> str:
+        return f"{self.base_url}/{category}/{function_name}/{function_name}.py"
+
+    def check_url(self, category: str, function_name: str) -> str:
+        return f"{self.base_url}/{category}/{function_name}/chk_{function_name}.py"
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """실행 중인 이벤트 루프에서 최초 사용 시 클라이언트 생성"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def fetch(self, url: str) -> str:
+        """URL 본문 반환 (실패 시 httpx.HTTPError / SourceUnavailable)"""
+        if self.cache is None:
+            return await self._single_flight(url, None)
+
+        entry = self.cache.get_memory(url)
+        if entry is None:
+            entry = await asyncio.to_thread(self.cache.get, url)
+        if entry is not None and entry.is_fresh(self.cache.ttl):
+            return entry.content
+        if entry is not None and self.offline:
+            self.cache.counters["stale_served"] += 1
+            return entry.content
+        if self.offline:
+            raise SourceUnavailable(f"오프라인 모드: 캐시에 없는 파일입니다 ({url})")
+        return await self._single_flight(url, entry)
+
+    async def _single_flight(self, url: str, entry) -> str:
+        """같은 URL 원격 요청은 하나만 보내고 나머지 호출은 그 결과를 기다림"""
+        task = self._in_flight.get(url)
+        if task is None:
+            coro = self._download(url) if self.cache is None else self._refresh(url, entry)
+            task = asyncio.ensure_future(coro)
+            self._in_flight[url] = task
+            task.add_done_callback(lambda done: self._finish(url, done))
+            self.counters["upstream"] += 1
+        else:
+            self.counters["coalesced"] += 1
+        # 기다리던 호출 하나가 취소되어도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    def _finish(self, url: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(url, None)
+        # 기다리던 호출이 모두 취소된 경우에도 "exception was never retrieved" 경고가 남지 않도록
+        if not task.cancelled():
+            task.exception()
+
+    async def _refresh(self, url: str, entry) -> str:
+        """만료 / 미보유 항목을 원격에서 받아 캐시 갱신 (ETag 재검증)"""
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        try:
+            await self.limiter.acquire()
+            response = await self._get(url, headers)
+        except httpx.TransportError:
+            # 네트워크 장애 시 만료된 캐시라도 반환
+            if entry is None:
+                raise
+            self.cache.counters["stale_served"] += 1
+            return entry.content
+
+        if response.status_code == 304 and entry is not None:
+            return (await asyncio.to_thread(self.cache.touch, entry)).content
+
+        response.raise_for_status()
+        entry = await asyncio.to_thread(self.cache.put, url, response.text, response.headers.get("ETag"))
+        return entry.content
+
+    async def _get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        """원격 요청 1회 (rate limit 대기 제외한 소요 시간을 응답 코드별로 기록)"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self.client.get(url, headers=headers)
+            outcome = str(response.status_code)
+            return response
+        finally:
+            if self.latency is not None:
+                self.latency.observe(time.perf_counter() - started, outcome=outcome)
+
+    async def _download(self, url: str) -> str:
+        await self.limiter.acquire()
+        response = await self._get(url)
+        response.raise_for_status()
+        return response.text
+
+    def stats(self) -> dict:
+        return {**self.counters, "in_flight": len(self._in_flight)}
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
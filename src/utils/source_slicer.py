@@ -0,0 +1,191 @@
+"""예제 소스 요약 (read_source_code 의 detail="sliced")
+
+examples_llm 파일 전체 대신 코드 생성에 필요한 부분만 남깁니다.
+
+    main 파일 : 모듈 상수(API_URL 등) + 공개 함수의 시그니처 / docstring / 요청 구성 구간(tr_id, params, _url_fetch 호출)
+    chk 파일  : 예제 함수 import + 호출 문장
+
+요약 결과는 원본 내용 해시로 SourceCache 에 함께 저장되어, 같은 파일은 다시 파싱하지 않습니다.
+"""
+import ast
+import hashlib
+import textwrap
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from src.utils.source_cache import SourceCache
+
+DETAIL_LEVELS = ("full", "sliced")
+# 요약 형식이 바뀌면 올려서 이전 캐시를 사용하지 않음
+SLICE_VERSION = 1
+# 요청 구성 구간으로 보는 변수 이름 (소문자 비교)
+REQUEST_NAMES = {"tr_id", "params", "body", "headers", "api_url", "url"}
+OMITTED = "..."
+
+
+def _lines(source_lines: List[str], node: ast.AST) -> List[str]:
+    return source_lines[node.lineno - 1:node.end_lineno]
+
+
+def _assigned_names(node: ast.AST) -> List[str]:
+    names = []
+    for child in ast.walk(node):
+        targets = []
+        if isinstance(child, ast.Assign):
+            targets = child.targets
+        elif isinstance(child, (ast.AnnAssign, ast.AugAssign)):
+            targets = [child.target]
+        for target in targets:
+            while isinstance(target, (ast.Subscript, ast.Attribute)):
+                target = target.value
+            if isinstance(target, ast.Name):
+                names.append(target.id.lower())
+    return names
+
+
+def _calls(node: ast.AST) -> List[str]:
+    """노드 안의 호출 이름 (ka._url_fetch -> _url_fetch)"""
+    names = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            func = child.func
+            if isinstance(func, ast.Attribute):
+                names.append(func.attr)
+            elif isinstance(func, ast.Name):
+                names.append(func.id)
+    return names
+
+
+def _is_request_statement(node: ast.stmt) -> bool:
+    if any(name in REQUEST_NAMES for name in _assigned_names(node)):
+        return True
+    return any(name.endswith("fetch") for name in _calls(node))
+
+
+def _body_without_docstring(node: ast.FunctionDef) -> List[ast.stmt]:
+    body = node.body
+    if ast.get_docstring(node) is not None:
+        body = body[1:]
+    return body
+
+
+def _select(source_lines: List[str], statements: List[ast.stmt], indent: str) -> List[str]:
+    """선택된 문장만 원래 들여쓰기로, 건너뛴 구간은 ... 한 줄로"""
+    out: List[str] = []
+    skipped = False
+    for statement in statements:
+        if _is_request_statement(statement):
+            if skipped and out:
+                out.append(f"{indent}{OMITTED}")
+            out.extend(_lines(source_lines, statement))
+            skipped = False
+        else:
+            skipped = True
+    if skipped:
+        out.append(f"{indent}{OMITTED}")
+    return out
+
+
+def _function_slice(source_lines: List[str], node: ast.FunctionDef) -> List[str]:
+    body = _body_without_docstring(node)
+    first = node.body[0]
+    # 시그니처: def 줄부터 본문 첫 문장 직전까지 (파라미터 주석 포함)
+    out = source_lines[node.lineno - 1:first.lineno - 1]
+    while out and not out[-1].strip():
+        out.pop()
+    if ast.get_docstring(node) is not None:
+        out.extend(_lines(source_lines, first))
+    if body:
+        indent = source_lines[body[0].lineno - 1][:body[0].col_offset]
+        out.extend(_select(source_lines, body, indent))
+    return out
+
+
+def _example_calls(source_lines: List[str], tree: ast.Module) -> List[str]:
+    """다른 예제 모듈에서 import 한 함수를 호출하는 문장 (chk 파일의 사용 예)"""
+    imported = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            for alias in node.names:
+                imported[alias.asname or alias.name] = node
+    if not imported:
+        return []
+
+    out: List[str] = []
+    used_imports: List[ast.ImportFrom] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.stmt) or isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef,
+                                                                ast.If, ast.For, ast.While, ast.Try, ast.With)):
+            continue
+        called = [name for name in _calls(node) if name in imported]
+        if called:
+            out.append(textwrap.dedent("\n".join(_lines(source_lines, node))))
+            for name in called:
+                if imported[name] not in used_imports:
+                    used_imports.append(imported[name])
+    imports = ["\n".join(_lines(source_lines, node)) for node in sorted(used_imports, key=lambda n: n.lineno)]
+    return imports + out
+
+
+def slice_source(text: str) -> Optional[str]:
+    """소스 요약 텍스트 (파싱할 수 없거나 남길 부분이 없으면 None)"""
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return None
+    source_lines = text.splitlines()
+
+    constants: List[str] = []
+    functions: List[List[str]] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            if all(isinstance(target, ast.Name) and target.id.isupper() for target in node.targets):
+                constants.extend(_lines(source_lines, node))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and not node.name.startswith("_") \
+                and node.name != "main":
+            functions.append(_function_slice(source_lines, node))
+
+    if functions:
+        parts = ["\n".join(constants)] if constants else []
+        parts.extend("\n".join(lines) for lines in functions)
+    else:
+        examples = _example_calls(source_lines, tree)
+        if not examples:
+            return None
+        parts = examples
+    return "\n\n".join(parts) + "\n"
+
+
+class SourceSlicer:
+    """slice_source 결과를 원본 해시로 캐시 (메모리 LRU + SourceCache 디스크)"""
+
+    def __init__(self, cache: Optional[SourceCache] = None, memory_size: int = 512):
+        self.cache = cache
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "unsliceable": 0}
+
+    def slice(self, text: str) -> Optional[str]:
+        """요약 텍스트 (요약할 수 없으면 None, 호출 측에서 원문 사용)"""
+        key = f"v{SLICE_VERSION}-{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+        if key in self._memory:
+            self.counters["hits"] += 1
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        sliced = self.cache.get_derived("slices", key) if self.cache is not None else None
+        if sliced is not None:
+            self.counters["hits"] += 1
+        else:
+            self.counters["misses"] += 1
+            sliced = slice_source(text)
+            if sliced is None:
+                self.counters["unsliceable"] += 1
+            elif self.cache is not None:
+                self.cache.put_derived("slices", key, sliced)
+        self._memory[key] = sliced
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+        return sliced
+
+    def stats(self) -> dict:
+        return {**self.counters, "memory_entries": len(self._memory)}
@@ -0,0 +1,88 @@
+"""
+Created on 20250601
+@author: LaivData SJPark with cursor
+"""
+
+import logging
+import sys
+
+import pandas as pd
+
+sys.path.extend(['../..', '.'])
+import kis_auth as ka
+from inquire_price import inquire_price
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+##############################################################################################
+# [국내주식] 기본시세 > 주식현재가 시세[v1_국내주식-008]
+##############################################################################################
+
+COLUMN_MAPPING = {
+    'iscd_stat_cls_code': '종목 상태 구분 코드',
+    'marg_rate': '증거금 비율',
+    'rprs_mrkt_kor_name': '대표 시장 한글 명',
+    'stck_prpr': '주식 현재가',
+    'prdy_vrss': '전일 대비',
+    'prdy_ctrt': '전일 대비율',
+    'acml_vol': '누적 거래량',
+    'stck_oprc': '주식 시가2',
+    'stck_hgpr': '주식 최고가',
+    'stck_lwpr': '주식 최저가',
+}
+
+NUMERIC_COLUMNS = ['증거금 비율', '주식 현재가', '전일 대비', '전일 대비율', '누적 거래량']
+
+
+def main():
+    """
+    [국내주식] 기본시세
+    주식현재가 시세[v1_국내주식-008]
+
+    주식현재가 시세 API를 호출하여 결과를 출력합니다.
+    """
+
+    # pandas 출력 옵션 설정
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+    pd.set_option('display.max_rows', None)
+
+    try:
+        # 토큰 발급
+        logger.info("토큰 발급 중...")
+        ka.auth()
+        logger.info("토큰 발급 완료")
+
+        # API 호출
+        logger.info("API 호출")
+        result = inquire_price(env_dv="real", fid_cond_mrkt_div_code="J", fid_input_iscd="005930")
+
+        if result is None or result.empty:
+            logger.warning("조회된 데이터가 없습니다.")
+            return
+
+        # 컬럼명 출력
+        logger.info("사용 가능한 컬럼 목록:")
+        logger.info(result.columns.tolist())
+
+        # 한글 컬럼명으로 변환
+        result = result.rename(columns=COLUMN_MAPPING)
+
+        # 숫자형 컬럼 소수점 둘째자리까지 표시
+        for col in NUMERIC_COLUMNS:
+            if col in result.columns:
+                result[col] = pd.to_numeric(result[col], errors='coerce').round(2)
+
+        # 결과 출력
+        logger.info("결과:")
+        print(result)
+
+    except Exception as e:
+        logger.error("에러 발생: %s" % str(e))
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""parse_arg_specs: data2.csv args 셀 형식별 파싱 결과"""
+from src.utils.catalog import parse_arg_specs
+
+
+def test_required_optional_default_example():
+    specs = parse_arg_specs(
+        "cano (str): 종합계좌번호 (예: '12345678')\n"
+        "tr_cont (str): 연속 거래 여부 (기본값: \"\")\n"
+        "buy_dt (str, optional): 매수일자. Defaults to \"\".\n"
+        "token (Optional[str]): 접근토큰 (OAuth 토큰이 필요한 API 경우 발급한 Access token)\n"
+        "unit_price (str): [필수] 주문가격1 (ex 0:시장가/최유리, 그 외 가격)\n"
+        "**kwargs: srs_cd_01, srs_cd_02, ... srs_cd_32 품목종류 코드들"
+    )
+    assert [(s["name"], s["type"], s["required"]) for s in specs] == [
+        ("cano", "str", True),
+        ("tr_cont", "str", False),
+        ("buy_dt", "str", False),
+        ("token", "Optional[str]", False),
+        ("unit_price", "str", True),
+        ("**kwargs", None, False),
+    ]
+    assert specs[0]["description"] == "종합계좌번호"
+    assert specs[0]["example"] == "12345678"
+    assert specs[1]["default"] == ""
+    assert specs[2]["default"] == ""
+    assert specs[2]["description"] == "매수일자."
+    assert specs[3]["example"] is None and specs[3]["default"] is None
+    assert specs[4]["description"] == "주문가격1"
+    assert specs[4]["example"] == "0:시장가/최유리, 그 외 가격"
+
+
+def test_example_forms():
+    cases = {
+        "pdno (str): 채권종목코드(ex KR2033022D33)": ("채권종목코드", "KR2033022D33"),
+        "fid_input_iscd (str): 종목코드(ex) 005930(삼성전자))": ("종목코드", "005930(삼성전자)"),
+        "bsop_date (str): 기준일(ex)20240513)": ("기준일", "20240513"),
+        "fid_input_date_1 (str): 입력날짜 ~ (ex) 20240402)": ("입력날짜 ~", "20240402"),
+        "fid_input_iscd (str): [필수] 입력 종목코드 (ex. 종목코드 (ex 005930 삼성전자))":
+            ("입력 종목코드", "종목코드 (ex 005930 삼성전자)"),
+        # 닫는 괄호가 빠진 원본 셀
+        "fid_input_iscd (str): 입력종목코드(ex 52K577(미래 K577KOSDAQ150콜)":
+            ("입력종목코드", "52K577(미래 K577KOSDAQ150콜)"),
+    }
+    for line, expected in cases.items():
+        spec = parse_arg_specs(line)[0]
+        assert (spec["description"], spec["example"]) == expected, line
+
+
+def test_exchange_word_is_not_example():
+    spec = parse_arg_specs("excg_cd (str): 거래소코드 (exchange code)")[0]
+    assert spec["example"] is None
+    assert spec["description"] == "거래소코드 (exchange code)"
+
+
+def test_continuation_line():
+    specs = parse_arg_specs("env_dv (str): [필수] 실전모의구분\n(real:실전, demo:모의)")
+    assert len(specs) == 1
+    assert specs[0]["description"] == "실전모의구분\n(real:실전, demo:모의)"
@@ -0,0 +1,60 @@
+"""search(output_field=...): column_mapping 응답 필드 코드 / 한글 이름 역색인 검색"""
+import os
+import shutil
+
+import pytest
+
+from src.utils.api_searcher import APISearcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def searcher(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("catalog")
+    for name in ("data2.csv", "data.csv"):
+        shutil.copy(os.path.join(ROOT, name), directory / name)
+    return APISearcher(str(directory / "data2.csv"), supplement_path=str(directory / "data.csv"))
+
+
+def _matched(result):
+    return {(field["field"], field["label"]) for record in result["results"] for field in record["matched_fields"]}
+
+
+def test_field_by_code(searcher):
+    result = searcher.search(output_field="stck_prpr")
+    assert result["status"] == "success"
+    assert result["message"].startswith(f"Found {result['total_count']} APIs returning stck_prpr")
+    assert "partial match" not in result["message"]
+    assert {code for code, _ in _matched(result)} == {"stck_prpr"}
+    # 대소문자 무시
+    assert searcher.search(output_field="STCK_PRPR")["total_count"] == result["total_count"]
+
+
+def test_field_by_korean_label(searcher):
+    result = searcher.search(output_field="체결 강도")
+    assert result["status"] == "success"
+    assert "partial match" not in result["message"]
+    # 공백 차이 무시, 같은 이름의 코드가 함께 반환됨
+    assert ("cttr", "체결강도") in _matched(result)
+
+
+def test_field_partial_match(searcher):
+    result = searcher.search(output_field="체결강")
+    assert result["status"] == "success"
+    assert "(partial match: 체결강)" in result["message"]
+    assert all("체결강" in label.replace(" ", "") for _, label in _matched(result))
+
+
+def test_multiple_fields_with_category(searcher):
+    result = searcher.search(output_field="stck_prpr,prdy_vrss", category="domestic_stock")
+    assert result["status"] == "success"
+    assert all(record["category"] == "domestic_stock" for record in result["results"])
+    for record in result["results"]:
+        assert {field["field"] for field in record["matched_fields"]} == {"stck_prpr", "prdy_vrss"}
+
+
+def test_field_miss(searcher):
+    result = searcher.search(output_field="xxxnotafield")
+    assert result["status"] == "no_results"
+    assert result["message"] == "No APIs return fields: xxxnotafield"
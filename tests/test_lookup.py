@@ -0,0 +1,54 @@
+"""APISearcher.lookup: TR ID(api_id) / REST 경로(url_name) 해시 조회"""
+import os
+import shutil
+
+import pytest
+
+from src.utils.api_searcher import APISearcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def searcher(tmp_path_factory):
+    # 컴파일 카탈로그(.kiscat)를 저장소가 아닌 임시 디렉터리에 생성
+    directory = tmp_path_factory.mktemp("catalog")
+    for name in ("data2.csv", "data.csv"):
+        shutil.copy(os.path.join(ROOT, name), directory / name)
+    return APISearcher(str(directory / "data2.csv"), supplement_path=str(directory / "data.csv"))
+
+
+def test_lookup_by_tr_id(searcher):
+    result = searcher.lookup("v1_국내주식-008")
+    assert result["status"] == "success"
+    assert result["message"] == "Found 1 APIs by api_id"
+    [record] = result["results"]
+    assert (record["category"], record["function_name"]) == ("domestic_stock", "inquire_price")
+    assert record["url_name"] == "/uapi/domestic-stock/v1/quotations/inquire-price"
+    assert record["method"] == "GET"
+    # 대소문자 차이 무시
+    assert searcher.lookup("V1_국내주식-008")["results"] == result["results"]
+
+
+@pytest.mark.parametrize("path", [
+    "/uapi/domestic-stock/v1/quotations/inquire-price",
+    "/uapi/domestic-stock/v1/quotations/inquire-price/",
+    "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/inquire-price",
+])
+def test_lookup_by_rest_path(searcher, path):
+    result = searcher.lookup(path)
+    assert result["status"] == "success"
+    assert result["message"] == "Found 1 APIs by url_name"
+    [record] = result["results"]
+    assert (record["category"], record["function_name"], record["api_id"]) == \
+        ("domestic_stock", "inquire_price", "v1_국내주식-008")
+
+
+def test_lookup_miss(searcher):
+    result = searcher.lookup("FHKST01010100")
+    assert result["status"] == "no_results"
+    assert result["total_count"] == 0 and result["results"] == []
+    assert result["catalog_version"] == searcher.catalog_version[:12]
+    # 부분 문자열로는 찾지 않음
+    assert searcher.lookup("/uapi/domestic-stock/v1/quotations")["status"] == "no_results"
+    assert searcher.lookup("  ")["status"] == "error"
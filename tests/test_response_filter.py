@@ -0,0 +1,39 @@
+"""search(response=...): data.csv 응답 명세로 거르고, 확인할 수 없는 행은 뒤에 표시"""
+import os
+import shutil
+
+import pytest
+
+from src.utils.api_searcher import APISearcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def searcher(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("catalog")
+    for name in ("data2.csv", "data.csv"):
+        shutil.copy(os.path.join(ROOT, name), directory / name)
+    searcher = APISearcher(str(directory / "data2.csv"), supplement_path=str(directory / "data.csv"))
+    searcher.MAX_RESULTS = 1000
+    return searcher
+
+
+def test_verified_rows_first(searcher):
+    result = searcher.search(subcategory="기본시세", response="현재가")
+    assert result["status"] == "success"
+    flags = [bool(record.get("response_unverified")) for record in result["results"]]
+    assert flags[0] is False
+    # 확인된 행 뒤에만 response_unverified 행이 옴
+    assert flags == sorted(flags)
+
+
+def test_unverified_rows_are_marked(searcher):
+    result = searcher.search(subcategory="기본시세", response="표면금리")
+    assert result["status"] == "success"
+    assert all(record["response_unverified"] is True for record in result["results"])
+
+
+def test_response_without_supplement_match(searcher):
+    result = searcher.search(subcategory="기본시세", response="절대로없는응답필드이름")
+    assert all(record.get("response_unverified") for record in result["results"])
@@ -0,0 +1,47 @@
+"""APISearcher.search 와 기존 pandas 구현(str.contains 마스크)의 결과 비교
+
+tests/data/search_parity_golden.json.gz 는 역색인 도입 전 pandas 구현으로 만든 기대 결과입니다
+(seed 0 무작위 조건 600개: category / subcategory 와 텍스트 컬럼 0~2개, 셀 일부 또는 노이즈 문자열).
+pandas 의존성이 제거되었으므로 결과를 고정해 두고 비교합니다.
+빈 셀은 컴파일 카탈로그와 같이 빈 문자열로 읽었습니다 (read_csv(keep_default_na=False), 'nan' 으로 매칭되지 않음).
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from src.utils.api_searcher import APISearcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(ROOT, "data2.csv")
+GOLDEN_PATH = os.path.join(ROOT, "tests", "data", "search_parity_golden.json.gz")
+
+with gzip.open(GOLDEN_PATH, "rt", encoding="utf-8") as f:
+    GOLDEN = json.load(f)
+
+
+@pytest.fixture(scope="module")
+def searcher(tmp_path_factory):
+    with open(DATA_PATH, "rb") as f:
+        if hashlib.sha256(f.read()).hexdigest() != GOLDEN["csv_sha256"]:
+            pytest.skip("data2.csv 가 기대 결과를 만든 뒤 변경됨 (골든 파일 재생성 필요)")
+    # 컴파일 카탈로그(.kiscat)를 저장소가 아닌 임시 디렉터리에 생성
+    path = tmp_path_factory.mktemp("catalog") / "data2.csv"
+    shutil.copy(DATA_PATH, path)
+    return APISearcher(str(path))
+
+
+@pytest.mark.parametrize("case", GOLDEN["cases"], ids=lambda case: json.dumps(case["params"], ensure_ascii=False))
+def test_search_matches_pandas(searcher, case):
+    result = searcher.search(**case["params"])
+    result.pop("catalog_version", None)
+    expected = case["expected"]
+
+    # pandas 구현에서 결과가 없던 조건은 오타 허용 검색(fuzzy match)으로 찾은 결과를 허용
+    if expected["status"] == "no_results" and "fuzzy match" in result["message"]:
+        assert result["status"] == "success"
+        return
+    assert result == expected
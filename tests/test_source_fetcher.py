@@ -0,0 +1,109 @@
+"""SourceFetcher single-flight: 같은 URL 동시 요청은 원격 요청 하나로 합침"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.utils.source_cache import SourceCache
+from src.utils.source_fetcher import SourceFetcher
+
+URL = "https://example.test/domestic_stock/inquire_price/inquire_price.py"
+
+
+class SlowTransport:
+    """release 될 때까지 응답을 보류하는 mock transport (호출 수 기록)"""
+
+    def __init__(self, status_code: int = 200, text: str = "print('ok')\n"):
+        self.status_code = status_code
+        self.text = text
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await self.release.wait()
+        return httpx.Response(self.status_code, text=self.text, headers={"ETag": '"v1"'})
+
+
+def _fetcher(transport: SlowTransport, cache=None) -> SourceFetcher:
+    fetcher = SourceFetcher(cache=cache)
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+    return fetcher
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_concurrent_requests_share_one_call(tmp_path, use_cache):
+    async def run():
+        transport = SlowTransport()
+        fetcher = _fetcher(transport, SourceCache(str(tmp_path)) if use_cache else None)
+        waiters = [asyncio.ensure_future(fetcher.fetch(URL)) for _ in range(20)]
+        # 캐시 조회(스레드)를 마친 호출이 모두 진행 중인 요청에 합류할 때까지 응답 보류
+        while fetcher.stats()["coalesced"] < 19:
+            await asyncio.sleep(0.001)
+        transport.release.set()
+        results = await asyncio.gather(*waiters)
+        assert results == [transport.text] * 20
+        assert transport.calls == 1
+        assert fetcher.stats() == {"upstream": 1, "coalesced": 19, "in_flight": 0}
+        await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_request(tmp_path):
+    async def run():
+        transport = SlowTransport()
+        fetcher = _fetcher(transport, SourceCache(str(tmp_path)))
+        waiters = [asyncio.ensure_future(fetcher.fetch(URL)) for _ in range(3)]
+        while fetcher.stats()["coalesced"] < 2:
+            await asyncio.sleep(0.001)
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        transport.release.set()
+        assert await asyncio.gather(waiters[1], waiters[2]) == [transport.text] * 2
+        assert waiters[0].cancelled()
+        assert transport.calls == 1
+        await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_request_finishes_after_all_waiters_cancel(tmp_path):
+    async def run():
+        transport = SlowTransport()
+        cache = SourceCache(str(tmp_path))
+        fetcher = _fetcher(transport, cache)
+        waiters = [asyncio.ensure_future(fetcher.fetch(URL)) for _ in range(3)]
+        while fetcher.stats()["coalesced"] < 2:
+            await asyncio.sleep(0.001)
+        for waiter in waiters:
+            waiter.cancel()
+        transport.release.set()
+        while fetcher.stats()["in_flight"]:
+            await asyncio.sleep(0.01)
+        # 공유 요청은 끝까지 진행되어 캐시에 저장됨
+        assert await fetcher.fetch(URL) == transport.text
+        assert transport.calls == 1
+        await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_error_is_shared_and_not_cached():
+    async def run():
+        transport = SlowTransport(status_code=404, text="Not Found")
+        fetcher = _fetcher(transport)
+        waiters = [asyncio.ensure_future(fetcher.fetch(URL)) for _ in range(5)]
+        while fetcher.stats()["coalesced"] < 4:
+            await asyncio.sleep(0.001)
+        transport.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+        assert transport.calls == 1
+        # 실패한 요청은 남지 않으므로 다음 호출은 다시 요청
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetcher.fetch(URL)
+        assert transport.calls == 2
+        await fetcher.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,64 @@
+"""slice_source / SourceSlicer: examples_llm 예제 파일 요약
+
+tests/data/examples 는 open-trading-api examples_llm/domestic_stock/inquire_price 의 예제 파일입니다.
+"""
+import os
+
+from src.utils.source_cache import SourceCache
+from src.utils.source_slicer import OMITTED, SourceSlicer, slice_source
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "examples")
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(EXAMPLES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_main_file_keeps_signature_and_request():
+    sliced = slice_source(_read("inquire_price.py"))
+    assert sliced.startswith('API_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"\n')
+    # 시그니처(파라미터 주석 포함) / docstring / tr_id / params / _url_fetch 호출
+    assert "fid_input_iscd: str  # [필수] 입력 종목코드" in sliced
+    assert "주식 현재가 시세 API입니다." in sliced
+    assert 'tr_id = "FHKST01010100"' in sliced
+    assert '"FID_INPUT_ISCD": fid_input_iscd' in sliced
+    assert 'res = ka._url_fetch(API_URL, tr_id, "", params)' in sliced
+    assert sliced.rstrip().endswith(OMITTED)
+    # 로깅 설정, 필수 파라미터 검증, 응답 처리는 제외
+    assert "logging.basicConfig" not in sliced
+    assert "env_dv is required" not in sliced
+    assert "res.getBody()" not in sliced
+    assert len(sliced) < len(_read("inquire_price.py"))
+
+
+def test_chk_file_keeps_import_and_call():
+    sliced = slice_source(_read("chk_inquire_price.py"))
+    assert sliced == (
+        "from inquire_price import inquire_price\n\n"
+        'result = inquire_price(env_dv="real", fid_cond_mrkt_div_code="J", fid_input_iscd="005930")\n'
+    )
+
+
+def test_syntax_error_falls_back(tmp_path):
+    broken = _read("inquire_price.py").replace("def inquire_price(", "def inquire_price(((", 1)
+    assert slice_source(broken) is None
+
+    slicer = SourceSlicer(SourceCache(str(tmp_path)))
+    assert slicer.slice(broken) is None
+    assert slicer.counters["unsliceable"] == 1
+    # 요약할 수 없는 결과는 디스크에 저장하지 않음
+    assert SourceSlicer(SourceCache(str(tmp_path))).slice(broken) is None
+
+
+def test_slices_are_cached_by_content(tmp_path):
+    text = _read("inquire_price.py")
+    slicer = SourceSlicer(SourceCache(str(tmp_path)))
+    first = slicer.slice(text)
+    assert slicer.slice(text) == first
+    assert slicer.counters == {"hits": 1, "misses": 1, "unsliceable": 0}
+
+    # 새 인스턴스는 SourceCache 디스크에서 읽음
+    reopened = SourceSlicer(SourceCache(str(tmp_path)))
+    assert reopened.slice(text) == first
+    assert reopened.counters["hits"] == 1